@@ -10,7 +10,8 @@ __all__ = [
     'TrendFollowingBot',
     'BreakoutStrategyBot',
     'MeanReversionBot',
-    'BTC4HSMBot',
+    'BTC4H5MBot',
+    'GridRangeBot',
 ]
 
 from .main import StrOneApp
@@ -25,4 +26,5 @@ from .metanet_manager import (
 from .bots.trend_following import TrendFollowingBot
 from .bots.breakout_strategy import BreakoutStrategyBot
 from .bots.mean_reversion import MeanReversionBot
-from .bots.btc4h5m import BTC4HSMBot
\ No newline at end of file
+from .bots.btc4h5m import BTC4H5MBot
+from .bots.grid_range import GridRangeBot
@@ -13,6 +13,11 @@ __all__ = [
     'BTC4H5MBot',
     'apply_btc4h5m_strategy',
     'generate_btc4h5m_signal',
+    'GridRangeBot',
+    'apply_grid_range_strategy',
+    'generate_grid_range_signal',
+    'RollingExtremes',
+    'grid_levels',
 ]
 
 from .trend_following import TrendFollowingBot, apply_strategy, generate_signal
@@ -31,3 +36,10 @@ from .btc4h5m import (
     apply_strategy as apply_btc4h5m_strategy,
     generate_signal as generate_btc4h5m_signal,
 )
+from .grid_range import (
+    GridRangeBot,
+    RollingExtremes,
+    apply_strategy as apply_grid_range_strategy,
+    generate_signal as generate_grid_range_signal,
+    grid_levels,
+)
@@ -10,8 +10,12 @@ import pandas as pd
 import numpy as np
 from typing import Dict
 
+from ..indicators import as_float_array, compact_dtype, rolling_max, rolling_min, shift
+from ..profiling import bot_stage, profiled
 
-def apply_strategy(df: pd.DataFrame, period: int = 20) -> pd.DataFrame:
+
+@profiled("apply_strategy")
+def apply_strategy(df: pd.DataFrame, period: int = 20, compact: bool = False) -> pd.DataFrame:
     """Calculate Donchian channel breakout signals on ``df``.
 
     Parameters
@@ -20,25 +24,38 @@ def apply_strategy(df: pd.DataFrame, period: int = 20) -> pd.DataFrame:
         DataFrame with ``high``, ``low`` and ``close`` columns.
     period : int, optional
         Lookback window for the Donchian channels.
+    compact : bool, optional
+        Compute on ``float32`` prices and return a new frame holding only the
+        computed columns instead of a copy of ``df``.
 
     Returns
     -------
     pandas.DataFrame
         DataFrame with ``upper_band``, ``lower_band`` and ``signal`` columns.
     """
-    df = df.copy()
-    df["upper_band"] = df["high"].rolling(window=period).max()
-    df["lower_band"] = df["low"].rolling(window=period).min()
-    df["signal"] = 0
-    df["signal"] = np.where(
-        df["close"] > df["upper_band"].shift(1),
-        1,
-        np.where(df["close"] < df["lower_band"].shift(1), -1, 0),
-    )
-    return df
-
-
-def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", period: int = 20) -> Dict[str, object]:
+    dtype = compact_dtype(compact)
+    close = as_float_array(df["close"].to_numpy(), dtype)
+    upper_band = rolling_max(as_float_array(df["high"].to_numpy(), dtype), period)
+    lower_band = rolling_min(as_float_array(df["low"].to_numpy(), dtype), period)
+    with np.errstate(invalid="ignore"):
+        signal = np.where(
+            close > shift(upper_band),
+            1,
+            np.where(close < shift(lower_band), -1, 0),
+        )
+    if compact:
+        signal = signal.astype(np.int8)
+    columns = {"upper_band": upper_band, "lower_band": lower_band, "signal": signal}
+    return pd.DataFrame(columns, index=df.index) if compact else df.assign(**columns)
+
+
+@profiled("generate_signal")
+def generate_signal(
+    df: pd.DataFrame,
+    asset: str = "BTCUSD",
+    period: int = 20,
+    compact: bool = False,
+) -> Dict[str, object]:
     """Generate a MetaNet-compatible signal dictionary from ``df``.
 
     Parameters
@@ -49,18 +66,21 @@ def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", period: int = 20) -
         Asset identifier included in the resulting dictionary.
     period : int, optional
         Lookback period for Donchian channels.
+    compact : bool, optional
+        Use the reduced-memory ``float32`` mode of :func:`apply_strategy`.
 
     Returns
     -------
     Dict[str, object]
         Dictionary with ``asset``, ``score``, ``signal`` and ``confidence``.
     """
-    result = apply_strategy(df, period)
+    result = apply_strategy(df, period, compact)
     last = result.iloc[-1]
+    close = float(df["close"].iloc[-1])
     if last["signal"] == 1:
-        score = float(last["close"] - last["upper_band"])
+        score = float(close - last["upper_band"])
     elif last["signal"] == -1:
-        score = float(last["lower_band"] - last["close"])
+        score = float(last["lower_band"] - close)
     else:
         score = 0.0
     width = float(max(last["upper_band"] - last["lower_band"], 1e-8))
@@ -77,13 +97,23 @@ def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", period: int = 20) -
 class BreakoutStrategyBot:
     """Bot wrapper for the breakout strategy."""
 
-    def __init__(self, bot_id: str, manager, asset: str = "BTCUSD", period: int = 20) -> None:
+    def __init__(
+        self,
+        bot_id: str,
+        manager,
+        asset: str = "BTCUSD",
+        period: int = 20,
+        compact: bool = False,
+    ) -> None:
         self.bot_id = bot_id
         self.manager = manager
         self.asset = asset
         self.period = period
+        self.compact = compact
 
     def on_new_data(self, df: pd.DataFrame) -> None:
         """Generate a signal from ``df`` and send it to ``MetaNetManager``."""
-        signal = generate_signal(df, self.asset, self.period)
-        self.manager.receive_signal(self.bot_id, signal)
+        with bot_stage(self.bot_id, "on_new_data"):
+            signal = generate_signal(df, self.asset, self.period, self.compact)
+            with bot_stage(self.bot_id, "receive_signal"):
+                self.manager.receive_signal(self.bot_id, signal)
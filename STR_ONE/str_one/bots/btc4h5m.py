@@ -9,11 +9,14 @@ simplified trading signal to the manager.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 import ta
 
+from ..profiling import bot_stage, profiled
+
 
 @dataclass
 class StrategyParams:
@@ -26,31 +29,142 @@ class StrategyParams:
     rsi_sell: int = 45
 
 
-def apply_strategy(df: pd.DataFrame, params: StrategyParams | None = None) -> pd.DataFrame:
-    """Compute indicators and trading signals on ``df``."""
-    if params is None:
-        params = StrategyParams()
+def _signal_columns(close, atr, rsi, ema20, ema50, params: StrategyParams) -> Dict[str, object]:
+    atr_pct = atr / close
+    trend_up = (close > ema20) & (ema20 > ema50)
+    trend_down = (close < ema20) & (ema20 < ema50)
+
+    cond_long = (atr_pct > params.min_atr_pct) & (rsi > params.rsi_buy) & trend_up
+    cond_short = (atr_pct > params.min_atr_pct) & (rsi < params.rsi_sell) & trend_down
+
+    signal = np.zeros(len(close), dtype=int)
+    signal[np.asarray(cond_long)] = 1
+    signal[np.asarray(cond_short)] = -1
+    return {
+        "atr": atr,
+        "rsi": rsi,
+        "ema20": ema20,
+        "ema50": ema50,
+        "atr_pct": atr_pct,
+        "signal": signal,
+    }
+
+
+def _ewm_continue(values: np.ndarray, prev: Optional[float], **ewm_kwargs) -> np.ndarray:
+    """``ewm(adjust=False).mean()`` of ``values`` resumed from the output ``prev``.
 
-    df = df.copy()
-    df["atr"] = ta.volatility.average_true_range(df["high"], df["low"], df["close"], params.atr_len)
-    df["rsi"] = ta.momentum.rsi(df["close"], params.rsi_len)
-    df["ema20"] = ta.trend.ema_indicator(df["close"], 20)
-    df["ema50"] = ta.trend.ema_indicator(df["close"], 50)
+    With ``adjust=False`` the only state is the previous mean, so prepending it
+    as the first observation reproduces the uninterrupted computation.
+    """
+    if prev is None:
+        return pd.Series(values).ewm(adjust=False, **ewm_kwargs).mean().to_numpy(copy=True)
+    series = pd.Series(np.concatenate(([prev], values)))
+    return series.ewm(adjust=False, **ewm_kwargs).mean().to_numpy(copy=True)[1:]
 
-    df["atr_pct"] = df["atr"] / df["close"]
-    trend_up = (df["close"] > df["ema20"]) & (df["ema20"] > df["ema50"])
-    trend_down = (df["close"] < df["ema20"]) & (df["ema20"] < df["ema50"])
 
-    cond_long = (df["atr_pct"] > params.min_atr_pct) & (df["rsi"] > params.rsi_buy) & trend_up
-    cond_short = (df["atr_pct"] > params.min_atr_pct) & (df["rsi"] < params.rsi_sell) & trend_down
+class BTC4H5MState:
+    """Resumable version of :func:`apply_strategy`.
 
-    df["signal"] = 0
-    df.loc[cond_long, "signal"] = 1
-    df.loc[cond_short, "signal"] = -1
+    Carries the EMA, RSI and ATR recursions (and their warm-up) across
+    consecutive blocks of bars, reproducing the ``ta`` indicators used by
+    :func:`apply_strategy` on the whole history.
+    """
+
+    def __init__(self, params: StrategyParams | None = None) -> None:
+        self.params = params or StrategyParams()
+        self.count = 0
+        self.prev_close: Optional[float] = None
+        self.ema: Dict[int, Optional[float]] = {20: None, 50: None}
+        self.ema_up: Optional[float] = None
+        self.ema_down: Optional[float] = None
+        self.atr: Optional[float] = None
+        self._tr_warmup: list = []
+
+    def _warmup_mask(self, n: int, window: int) -> np.ndarray:
+        return np.arange(self.count, self.count + n) < window - 1
+
+    def _atr(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        window = self.params.atr_len
+        prev_close = np.empty(len(close))
+        prev_close[0] = np.nan if self.prev_close is None else self.prev_close
+        prev_close[1:] = close[:-1]
+        true_range = pd.DataFrame(
+            {"tr1": high - low, "tr2": np.abs(high - prev_close), "tr3": np.abs(low - prev_close)}
+        ).max(axis=1).to_numpy()
+
+        atr = np.zeros(len(close))
+        for i, value in enumerate(true_range):
+            index = self.count + i
+            if index < window - 1:
+                self._tr_warmup.append(value)
+            elif index == window - 1:
+                self._tr_warmup.append(value)
+                self.atr = pd.Series(self._tr_warmup).mean()
+                self._tr_warmup = []
+                atr[i] = self.atr
+            else:
+                self.atr = (self.atr * (window - 1) + value) / float(window)
+                atr[i] = self.atr
+        return atr
+
+    def _rsi(self, close: np.ndarray) -> np.ndarray:
+        window = self.params.rsi_len
+        prev = np.nan if self.prev_close is None else self.prev_close
+        diff = np.diff(close, prepend=prev)
+        with np.errstate(invalid="ignore"):
+            up = np.where(diff > 0, diff, 0.0)
+            down = -np.where(diff < 0, diff, 0.0)
+        ema_up = _ewm_continue(up, self.ema_up, alpha=1 / window)
+        ema_down = _ewm_continue(down, self.ema_down, alpha=1 / window)
+        self.ema_up, self.ema_down = ema_up[-1], ema_down[-1]
+
+        mask = self._warmup_mask(len(close), window)
+        ema_up[mask] = np.nan
+        ema_down[mask] = np.nan
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(ema_down == 0, 100, 100 - (100 / (1 + ema_up / ema_down)))
+
+    def _ema(self, close: np.ndarray, window: int) -> np.ndarray:
+        ema = _ewm_continue(close, self.ema[window], span=window)
+        self.ema[window] = ema[-1]
+        ema[self._warmup_mask(len(close), window)] = np.nan
+        return ema
+
+    def update(self, high, low, close) -> Dict[str, object]:
+        """Consume the next block of bars and return its computed columns."""
+        high = np.asarray(high, dtype=float)
+        low = np.asarray(low, dtype=float)
+        close = np.asarray(close, dtype=float)
+        if not len(close):
+            return _signal_columns(close, close, close, close, close, self.params)
+
+        atr = self._atr(high, low, close)
+        rsi = self._rsi(close)
+        ema20 = self._ema(close, 20)
+        ema50 = self._ema(close, 50)
+        self.count += len(close)
+        self.prev_close = float(close[-1])
+        return _signal_columns(close, atr, rsi, ema20, ema50, self.params)
+
+
+@profiled("apply_strategy")
+def apply_strategy(df: pd.DataFrame, params: StrategyParams | None = None) -> pd.DataFrame:
+    """Compute indicators and trading signals on ``df``."""
+    if params is None:
+        params = StrategyParams()
 
-    return df
+    columns = _signal_columns(
+        df["close"].to_numpy(dtype=float),
+        ta.volatility.average_true_range(df["high"], df["low"], df["close"], params.atr_len).to_numpy(),
+        ta.momentum.rsi(df["close"], params.rsi_len).to_numpy(),
+        ta.trend.ema_indicator(df["close"], 20).to_numpy(),
+        ta.trend.ema_indicator(df["close"], 50).to_numpy(),
+        params,
+    )
+    return df.assign(**columns)
 
 
+@profiled("generate_signal")
 def generate_signal(
     df: pd.DataFrame,
     asset: str = "BTCUSD",
@@ -92,5 +206,7 @@ class BTC4H5MBot:
 
     def on_new_data(self, df: pd.DataFrame) -> None:
         """Generate a signal from ``df`` and send it to ``MetaNetManager``."""
-        signal = generate_signal(df, self.asset, self.params)
-        self.manager.receive_signal(self.bot_id, signal)
+        with bot_stage(self.bot_id, "on_new_data"):
+            signal = generate_signal(df, self.asset, self.params)
+            with bot_stage(self.bot_id, "receive_signal"):
+                self.manager.receive_signal(self.bot_id, signal)
@@ -0,0 +1,245 @@
+"""Dynamic grid-range strategy ported from the Pine helper script.
+
+Mirrors ``PINE_SCRIPTS/grid_range_dynamic_bot_helper.pine``: the grid spans
+the highest high and lowest low of the last ``refresh_bars`` bars, is split
+into ``levels_count`` evenly spaced levels and is refreshed every
+``refresh_bars`` bars. Crossing a level downwards is read as a buy and
+crossing it upwards as a sell, as a grid bot would do.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..profiling import bot_stage, profiled
+
+
+class RollingExtremes:
+    """Track the rolling highest high and lowest low with monotonic deques.
+
+    Each deque keeps ``(index, value)`` pairs whose values are monotonic, so
+    the current extreme is always at the front and every bar is pushed and
+    popped at most once (amortized O(1) per update).
+    """
+
+    def __init__(self, window: int) -> None:
+        if window < 1:
+            raise ValueError("window must be a positive integer")
+        self.window = window
+        self.count = 0
+        self._highs: deque = deque()
+        self._lows: deque = deque()
+
+    @property
+    def ready(self) -> bool:
+        """Whether a full window of bars has been seen."""
+        return self.count >= self.window
+
+    def update(self, high: float, low: float) -> Tuple[float, float]:
+        """Add one bar and return the ``(highest, lowest)`` of the window."""
+        index = self.count
+        self.count += 1
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((index, high))
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((index, low))
+
+        oldest = index - self.window
+        if self._highs[0][0] <= oldest:
+            self._highs.popleft()
+        if self._lows[0][0] <= oldest:
+            self._lows.popleft()
+        return self._highs[0][1], self._lows[0][1]
+
+
+def grid_levels(highs, lows, levels_count: int = 12) -> np.ndarray:
+    """Return evenly spaced grid levels for many ranges at once.
+
+    Parameters
+    ----------
+    highs, lows : array-like
+        Range bounds, one per asset (any matching shape).
+    levels_count : int, optional
+        Number of levels, including both bounds.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``highs.shape + (levels_count,)``.
+    """
+    if levels_count < 2:
+        raise ValueError("levels_count must be at least 2")
+    highs = np.asarray(highs, dtype=float)
+    lows = np.asarray(lows, dtype=float)
+    fractions = np.linspace(0.0, 1.0, levels_count)
+    return lows[..., None] + (highs - lows)[..., None] * fractions
+
+
+def grid_zones(closes, highs, lows, levels_count: int = 12) -> np.ndarray:
+    """Return the grid zone of each close, vectorized over any array shape.
+
+    Zone ``k`` lies between level ``k`` and ``k + 1``; closes below the grid
+    map to ``-1`` and closes at or above the top level to ``levels_count - 1``.
+    Missing ranges yield ``NaN``.
+    """
+    if levels_count < 2:
+        raise ValueError("levels_count must be at least 2")
+    closes = np.asarray(closes, dtype=float)
+    highs = np.asarray(highs, dtype=float)
+    lows = np.asarray(lows, dtype=float)
+    step = np.maximum((highs - lows) / (levels_count - 1), 1e-12)
+    with np.errstate(invalid="ignore"):
+        zones = np.floor((closes - lows) / step)
+    return np.clip(zones, -1, levels_count - 1)
+
+
+class GridRangeState:
+    """Resumable grid-range computation.
+
+    Holds the rolling extremes, the current grid and the last close, so bars
+    can be fed in consecutive blocks (see :mod:`str_one.chunked`) with the same
+    result as a single :func:`apply_strategy` call on the whole history.
+    """
+
+    def __init__(self, levels_count: int = 12, refresh_bars: int = 100, use_static: bool = False) -> None:
+        if levels_count < 2:
+            raise ValueError("levels_count must be at least 2")
+        self.levels_count = levels_count
+        self.refresh_bars = refresh_bars
+        self.use_static = use_static
+        self.tracker = RollingExtremes(refresh_bars)
+        self.grid_high = np.nan
+        self.grid_low = np.nan
+        self.prev_close = np.nan
+
+    def update(self, highs, lows, closes) -> Dict[str, np.ndarray]:
+        """Consume the next block of bars and return its computed columns."""
+        highs = np.asarray(highs, dtype=float)
+        lows = np.asarray(lows, dtype=float)
+        closes = np.asarray(closes, dtype=float)
+        n = len(closes)
+        refresh_bars = self.refresh_bars
+        grid_high = np.full(n, np.nan)
+        grid_low = np.full(n, np.nan)
+        for i in range(n):
+            highest, lowest = self.tracker.update(highs[i], lows[i])
+            index = self.tracker.count - 1
+            refresh = self.tracker.ready and (index - refresh_bars + 1) % refresh_bars == 0
+            if refresh and not (self.use_static and index >= refresh_bars):
+                self.grid_high, self.grid_low = highest, lowest
+            grid_high[i] = self.grid_high
+            grid_low[i] = self.grid_low
+
+        zones = grid_zones(closes, grid_high, grid_low, self.levels_count)
+        prev_closes = np.empty(n)
+        if n:
+            prev_closes[0] = self.prev_close
+            prev_closes[1:] = closes[:-1]
+            self.prev_close = closes[-1]
+        prev_zones = grid_zones(prev_closes, grid_high, grid_low, self.levels_count)
+        crossed = np.nan_to_num(prev_zones - zones)
+        return {
+            "grid_high": grid_high,
+            "grid_low": grid_low,
+            "grid_step": (grid_high - grid_low) / (self.levels_count - 1),
+            "zone": zones,
+            "levels_crossed": crossed,
+            "signal": np.sign(crossed).astype(int),
+        }
+
+
+@profiled("apply_strategy")
+def apply_strategy(
+    df: pd.DataFrame,
+    levels_count: int = 12,
+    refresh_bars: int = 100,
+    use_static: bool = False,
+) -> pd.DataFrame:
+    """Calculate grid ranges and level-crossing signals on ``df``.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        DataFrame with ``high``, ``low`` and ``close`` columns.
+    levels_count : int, optional
+        Number of grid levels.
+    refresh_bars : int, optional
+        Lookback window of the range and refresh interval of the grid. The
+        first grid is built once ``refresh_bars`` bars are available.
+    use_static : bool, optional
+        Keep the first grid instead of refreshing it.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame with ``grid_high``, ``grid_low``, ``grid_step``, ``zone``,
+        ``levels_crossed`` and ``signal`` columns.
+    """
+    state = GridRangeState(levels_count, refresh_bars, use_static)
+    columns = state.update(df["high"].to_numpy(), df["low"].to_numpy(), df["close"].to_numpy())
+    return df.assign(**columns)
+
+
+@profiled("generate_signal")
+def generate_signal(
+    df: pd.DataFrame,
+    asset: str = "BTCUSD",
+    levels_count: int = 12,
+    refresh_bars: int = 100,
+    use_static: bool = False,
+) -> Dict[str, object]:
+    """Generate a MetaNet-compatible signal dictionary from ``df``.
+
+    The score is the price distance of the levels crossed on the last bar
+    (positive for buys) and the confidence grows with the distance of the
+    close from the grid median.
+    """
+    result = apply_strategy(df, levels_count, refresh_bars, use_static)
+    last = result.iloc[-1]
+    if np.isnan(last["grid_high"]):
+        return {"asset": asset, "score": 0.0, "signal": "hold", "confidence": 0.0}
+
+    score = float(last["levels_crossed"] * last["grid_step"])
+    half_range = float(max((last["grid_high"] - last["grid_low"]) / 2, 1e-8))
+    median = (last["grid_high"] + last["grid_low"]) / 2
+    confidence = float(min(abs(last["close"] - median) / half_range, 1.0))
+    signal = "buy" if last["signal"] == 1 else "sell" if last["signal"] == -1 else "hold"
+    return {
+        "asset": asset,
+        "score": score,
+        "signal": signal,
+        "confidence": confidence,
+    }
+
+
+class GridRangeBot:
+    """Bot wrapper for the dynamic grid-range strategy."""
+
+    def __init__(
+        self,
+        bot_id: str,
+        manager,
+        asset: str = "BTCUSD",
+        levels_count: int = 12,
+        refresh_bars: int = 100,
+        use_static: bool = False,
+    ) -> None:
+        self.bot_id = bot_id
+        self.manager = manager
+        self.asset = asset
+        self.levels_count = levels_count
+        self.refresh_bars = refresh_bars
+        self.use_static = use_static
+
+    def on_new_data(self, df: pd.DataFrame) -> None:
+        """Generate a signal from ``df`` and send it to ``MetaNetManager``."""
+        with bot_stage(self.bot_id, "on_new_data"):
+            signal = generate_signal(df, self.asset, self.levels_count, self.refresh_bars, self.use_static)
+            with bot_stage(self.bot_id, "receive_signal"):
+                self.manager.receive_signal(self.bot_id, signal)
@@ -10,44 +10,60 @@ import pandas as pd
 import numpy as np
 from typing import Dict
 
+from .. import indicators
+from ..profiling import bot_stage, profiled
+
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
     """Compute the Relative Strength Index of ``series``."""
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+    return pd.Series(indicators.rsi(series.to_numpy(), period), index=series.index)
+
 
+@profiled("apply_strategy")
+def apply_strategy(df: pd.DataFrame, rsi_period: int = 5, compact: bool = False) -> pd.DataFrame:
+    """Calculate RSI and Bollinger Band signals on ``df``.
 
-def apply_strategy(df: pd.DataFrame, rsi_period: int = 5) -> pd.DataFrame:
-    """Calculate RSI and Bollinger Band signals on ``df``."""
-    df = df.copy()
-    df["rsi"] = rsi(df["close"], period=rsi_period)
-    df["ma20"] = df["close"].rolling(window=20).mean()
-    df["std"] = df["close"].rolling(window=20).std()
-    df["lower_bb"] = df["ma20"] - 2 * df["std"]
-    df["upper_bb"] = df["ma20"] + 2 * df["std"]
-    df["signal"] = np.where(
-        (df["rsi"] < 30) & (df["close"] < df["lower_bb"]),
-        1,
-        np.where(
-            (df["rsi"] > 70) & (df["close"] > df["upper_bb"]),
-            -1,
-            0,
-        ),
-    )
-    return df
+    With ``compact=True`` the prices are processed as ``float32`` and a new
+    frame with only the ``ma20``, ``lower_bb``, ``upper_bb`` and ``signal``
+    columns is returned instead of a copy of ``df``.
+    """
+    close = indicators.as_float_array(df["close"].to_numpy(), indicators.compact_dtype(compact))
+    rsi_values = indicators.rsi(close, rsi_period)
+    ma20 = indicators.rolling_mean(close, 20)
+    std = indicators.rolling_std(close, 20)
+    lower_bb = ma20 - 2 * std
+    upper_bb = ma20 + 2 * std
+    with np.errstate(invalid="ignore"):
+        signal = np.where(
+            (rsi_values < 30) & (close < lower_bb),
+            1,
+            np.where(
+                (rsi_values > 70) & (close > upper_bb),
+                -1,
+                0,
+            ),
+        )
+    if compact:
+        columns = {"ma20": ma20, "lower_bb": lower_bb, "upper_bb": upper_bb, "signal": signal.astype(np.int8)}
+        return pd.DataFrame(columns, index=df.index)
+    return df.assign(rsi=rsi_values, ma20=ma20, std=std, lower_bb=lower_bb, upper_bb=upper_bb, signal=signal)
 
 
-def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", rsi_period: int = 5) -> Dict[str, object]:
+@profiled("generate_signal")
+def generate_signal(
+    df: pd.DataFrame,
+    asset: str = "BTCUSD",
+    rsi_period: int = 5,
+    compact: bool = False,
+) -> Dict[str, object]:
     """Generate a signal dictionary from ``df`` for ``MetaNetManager``."""
-    result = apply_strategy(df, rsi_period)
+    result = apply_strategy(df, rsi_period, compact)
     last = result.iloc[-1]
+    close = float(df["close"].iloc[-1])
     if last["signal"] == 1:
-        score = float(last["ma20"] - last["close"])
+        score = float(last["ma20"] - close)
     elif last["signal"] == -1:
-        score = float(last["close"] - last["ma20"])
+        score = float(close - last["ma20"])
     else:
         score = 0.0
     width = float(max(last["upper_bb"] - last["lower_bb"], 1e-8))
@@ -64,13 +80,23 @@ def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", rsi_period: int = 5
 class MeanReversionBot:
     """Bot wrapper around the mean reversion strategy."""
 
-    def __init__(self, bot_id: str, manager, asset: str = "BTCUSD", rsi_period: int = 5) -> None:
+    def __init__(
+        self,
+        bot_id: str,
+        manager,
+        asset: str = "BTCUSD",
+        rsi_period: int = 5,
+        compact: bool = False,
+    ) -> None:
         self.bot_id = bot_id
         self.manager = manager
         self.asset = asset
         self.rsi_period = rsi_period
+        self.compact = compact
 
     def on_new_data(self, df: pd.DataFrame) -> None:
         """Create a signal from ``df`` and forward it to ``MetaNetManager``."""
-        signal = generate_signal(df, self.asset, self.rsi_period)
-        self.manager.receive_signal(self.bot_id, signal)
+        with bot_stage(self.bot_id, "on_new_data"):
+            signal = generate_signal(df, self.asset, self.rsi_period, self.compact)
+            with bot_stage(self.bot_id, "receive_signal"):
+                self.manager.receive_signal(self.bot_id, signal)
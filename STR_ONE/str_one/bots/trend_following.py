@@ -10,8 +10,17 @@ import pandas as pd
 import numpy as np
 from typing import Dict
 
+from ..indicators import as_float_array, compact_dtype, rolling_mean
+from ..profiling import bot_stage, profiled
 
-def apply_strategy(df: pd.DataFrame, short_window: int = 20, long_window: int = 50) -> pd.DataFrame:
+
+@profiled("apply_strategy")
+def apply_strategy(
+    df: pd.DataFrame,
+    short_window: int = 20,
+    long_window: int = 50,
+    compact: bool = False,
+) -> pd.DataFrame:
     """Calculate moving average cross signals on ``df``.
 
     Parameters
@@ -22,23 +31,32 @@ def apply_strategy(df: pd.DataFrame, short_window: int = 20, long_window: int =
         Period for the short moving average.
     long_window : int, optional
         Period for the long moving average.
+    compact : bool, optional
+        Compute on ``float32`` prices and return a new frame holding only the
+        computed columns instead of a copy of ``df``.
 
     Returns
     -------
     pandas.DataFrame
         DataFrame with ``ma_short``, ``ma_long`` and ``signal`` columns.
     """
-    df = df.copy()
-    df["ma_short"] = df["close"].rolling(window=short_window).mean()
-    df["ma_long"] = df["close"].rolling(window=long_window).mean()
-    df["signal"] = 0
-    df.loc[short_window:, "signal"] = np.where(
-        df["ma_short"][short_window:] > df["ma_long"][short_window:], 1, -1
-    )
-    return df
+    close = as_float_array(df["close"].to_numpy(), compact_dtype(compact))
+    ma_short = rolling_mean(close, short_window)
+    ma_long = rolling_mean(close, long_window)
+    signal = np.zeros(len(df), dtype=np.int8 if compact else int)
+    signal[short_window:] = np.where(ma_short[short_window:] > ma_long[short_window:], 1, -1)
+    columns = {"ma_short": ma_short, "ma_long": ma_long, "signal": signal}
+    return pd.DataFrame(columns, index=df.index) if compact else df.assign(**columns)
 
 
-def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", short_window: int = 20, long_window: int = 50) -> Dict[str, object]:
+@profiled("generate_signal")
+def generate_signal(
+    df: pd.DataFrame,
+    asset: str = "BTCUSD",
+    short_window: int = 20,
+    long_window: int = 50,
+    compact: bool = False,
+) -> Dict[str, object]:
     """Generate a signal dictionary for ``MetaNetManager`` from ``df``.
 
     Parameters
@@ -51,13 +69,15 @@ def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", short_window: int =
         Short moving average window.
     long_window : int, optional
         Long moving average window.
+    compact : bool, optional
+        Use the reduced-memory ``float32`` mode of :func:`apply_strategy`.
 
     Returns
     -------
     Dict[str, object]
         Dictionary with ``asset``, ``score``, ``signal`` and ``confidence``.
     """
-    result = apply_strategy(df, short_window, long_window)
+    result = apply_strategy(df, short_window, long_window, compact)
     last_row = result.iloc[-1]
     score = float(last_row["ma_short"] - last_row["ma_long"])
     signal = "buy" if last_row["signal"] > 0 else "sell"
@@ -72,14 +92,25 @@ def generate_signal(df: pd.DataFrame, asset: str = "BTCUSD", short_window: int =
 class TrendFollowingBot:
     """Simple bot wrapping the trend following strategy."""
 
-    def __init__(self, bot_id: str, manager, asset: str = "BTCUSD", short_window: int = 20, long_window: int = 50) -> None:
+    def __init__(
+        self,
+        bot_id: str,
+        manager,
+        asset: str = "BTCUSD",
+        short_window: int = 20,
+        long_window: int = 50,
+        compact: bool = False,
+    ) -> None:
         self.bot_id = bot_id
         self.manager = manager
         self.asset = asset
         self.short_window = short_window
         self.long_window = long_window
+        self.compact = compact
 
     def on_new_data(self, df: pd.DataFrame) -> None:
         """Generate a signal from ``df`` and send it to ``MetaNetManager``."""
-        signal = generate_signal(df, self.asset, self.short_window, self.long_window)
-        self.manager.receive_signal(self.bot_id, signal)
+        with bot_stage(self.bot_id, "on_new_data"):
+            signal = generate_signal(df, self.asset, self.short_window, self.long_window, self.compact)
+            with bot_stage(self.bot_id, "receive_signal"):
+                self.manager.receive_signal(self.bot_id, signal)
@@ -0,0 +1,220 @@
+"""Out-of-core backtesting of the str_one strategies.
+
+OHLCV data is streamed from CSV or Parquet files in fixed-size blocks. Each
+strategy keeps the state it needs between blocks: the window strategies carry
+the last bars of history (their longest lookback), while ``btc4h5m`` and
+``grid_range`` carry their EMA/RSI/ATR recursions and grid through resumable
+state objects. Memory is therefore bounded by the chunk size, and signals
+match an in-memory run on the full history: the recursive strategies are
+bit-identical, and the window strategies differ at most by float rounding
+of the cumulative-sum rolling means (about ``1e-12`` relative).
+
+Positions follow the last non-zero signal and the PnL of bar ``t`` is
+``position[t - 1] * (close[t] - close[t - 1])``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .bots import breakout_strategy, btc4h5m, grid_range, mean_reversion, trend_following
+
+DEFAULT_CHUNKSIZE = 100_000
+OHLC_COLUMNS = ["high", "low", "close"]
+
+
+def iter_ohlcv_chunks(path, chunksize: int = DEFAULT_CHUNKSIZE, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """Stream an OHLCV file in blocks of ``chunksize`` rows.
+
+    CSV files are read with ``pandas.read_csv``; ``.parquet`` files are read
+    batch by batch and need the optional ``pyarrow`` dependency.
+    """
+    path = Path(path)
+    columns = columns or OHLC_COLUMNS
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+    elif suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("Reading Parquet files requires pyarrow") from exc
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix!r}")
+
+
+class WindowedStrategy:
+    """Run a window-based ``apply_strategy`` over consecutive chunks.
+
+    The last ``lookback`` bars are prepended to every chunk, which covers the
+    rolling windows and shifts of the strategy, and the warm-up rows are
+    dropped from the result.
+    """
+
+    def __init__(self, apply: Callable[..., pd.DataFrame], lookback: int, **params) -> None:
+        self.apply = apply
+        self.lookback = lookback
+        self.params = params
+        self._tail: Optional[pd.DataFrame] = None
+
+    def update(self, chunk: pd.DataFrame) -> Dict[str, np.ndarray]:
+        frame = chunk[OHLC_COLUMNS].reset_index(drop=True)
+        if self._tail is not None:
+            frame = pd.concat([self._tail, frame], ignore_index=True)
+        warmup = len(frame) - len(chunk)
+        result = self.apply(frame, **self.params)
+        self._tail = frame.iloc[-self.lookback:].copy()
+        return {
+            column: result[column].to_numpy()[warmup:]
+            for column in result.columns
+            if column not in frame.columns
+        }
+
+
+class _StatefulStrategy:
+    """Adapter feeding chunks to a resumable ``update(high, low, close)`` state."""
+
+    def __init__(self, state) -> None:
+        self.state = state
+
+    def update(self, chunk: pd.DataFrame) -> Dict[str, np.ndarray]:
+        return self.state.update(
+            chunk["high"].to_numpy(dtype=float),
+            chunk["low"].to_numpy(dtype=float),
+            chunk["close"].to_numpy(dtype=float),
+        )
+
+
+def _trend_following(short_window: int = 20, long_window: int = 50):
+    return WindowedStrategy(
+        trend_following.apply_strategy,
+        max(short_window, long_window),
+        short_window=short_window,
+        long_window=long_window,
+    )
+
+
+def _breakout(period: int = 20):
+    return WindowedStrategy(breakout_strategy.apply_strategy, period + 1, period=period)
+
+
+def _mean_reversion(rsi_period: int = 5):
+    return WindowedStrategy(mean_reversion.apply_strategy, max(20, rsi_period + 1), rsi_period=rsi_period)
+
+
+def _btc4h5m(params: Optional[btc4h5m.StrategyParams] = None):
+    return _StatefulStrategy(btc4h5m.BTC4H5MState(params))
+
+
+def _grid_range(levels_count: int = 12, refresh_bars: int = 100, use_static: bool = False):
+    return _StatefulStrategy(grid_range.GridRangeState(levels_count, refresh_bars, use_static))
+
+
+STRATEGIES: Dict[str, Callable[..., object]] = {
+    "trend_following": _trend_following,
+    "breakout": _breakout,
+    "mean_reversion": _mean_reversion,
+    "btc4h5m": _btc4h5m,
+    "grid_range": _grid_range,
+}
+
+
+class ChunkedBacktest:
+    """Incremental backtest of one strategy over a stream of OHLCV chunks.
+
+    Parameters
+    ----------
+    strategy : str
+        Name of the strategy, one of :data:`STRATEGIES`.
+    **params
+        Keyword arguments of the strategy (e.g. ``period=20``).
+    """
+
+    def __init__(self, strategy: str, **params) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy!r}")
+        self.strategy = strategy
+        self._runner = STRATEGIES[strategy](**params)
+        self.bars = 0
+        self.trades = 0
+        self.position = 0.0
+        self.equity = 0.0
+        self._prev_close = np.nan
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Consume one chunk and return its signals, positions and PnL."""
+        columns = self._runner.update(chunk)
+        close = chunk["close"].to_numpy(dtype=float)
+        signal = np.asarray(columns["signal"])
+
+        position = pd.Series(np.where(signal != 0, signal, np.nan), dtype=float).ffill()
+        position = position.fillna(self.position).to_numpy()
+        prev_position = np.concatenate(([self.position], position[:-1]))
+        prev_close = np.concatenate(([self._prev_close], close[:-1]))
+        pnl = np.nan_to_num(prev_position * (close - prev_close))
+        equity = self.equity + np.cumsum(pnl)
+
+        self.trades += int(np.count_nonzero(position != prev_position))
+        self.bars += len(chunk)
+        if len(chunk):
+            self.position = float(position[-1])
+            self.equity = float(equity[-1])
+            self._prev_close = float(close[-1])
+        return pd.DataFrame(
+            {**columns, "position": position, "pnl": pnl, "equity": equity},
+            index=chunk.index,
+        )
+
+    def run(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Yield the result of every chunk as soon as it is processed."""
+        for chunk in chunks:
+            yield self.process(chunk)
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "strategy": self.strategy,
+            "bars": self.bars,
+            "trades": self.trades,
+            "position": self.position,
+            "pnl": self.equity,
+        }
+
+
+def backtest_file(path, strategy: str, chunksize: int = DEFAULT_CHUNKSIZE, **params) -> Iterator[pd.DataFrame]:
+    """Stream ``path`` through :class:`ChunkedBacktest`, yielding each chunk's result."""
+    return ChunkedBacktest(strategy, **params).run(iter_ohlcv_chunks(path, chunksize))
+
+
+def backtest_frame(df: pd.DataFrame, strategy: str, **params) -> pd.DataFrame:
+    """In-memory equivalent of :func:`backtest_file` on a whole DataFrame."""
+    return ChunkedBacktest(strategy, **params).process(df)
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Chunked out-of-core backtest of a str_one strategy")
+    parser.add_argument("path", type=Path, help="CSV or Parquet file with high, low and close columns")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="trend_following")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+    parser.add_argument("--output", type=Path, help="CSV file receiving the per-bar signals and PnL")
+    args = parser.parse_args(argv)
+
+    backtest = ChunkedBacktest(args.strategy)
+    first = True
+    for result in backtest.run(iter_ohlcv_chunks(args.path, args.chunksize)):
+        if args.output:
+            result.to_csv(args.output, mode="w" if first else "a", header=first, index_label="bar")
+            first = False
+        print(f"{backtest.bars} barre elaborate, PnL {backtest.equity:.2f}")
+    print(backtest.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,226 @@
+"""NumPy rolling-window kernels shared by the strategy modules.
+
+Every kernel works on a one-dimensional array and returns an array of the
+same length, with ``NaN`` wherever pandas' ``rolling(window)`` (default
+``min_periods=window``) would return ``NaN``: the first ``window - 1``
+positions and any window that contains a ``NaN``. Floating inputs keep their
+dtype (``float32`` stays ``float32``); everything else is computed as
+``float64``. Accumulations always run in ``float64``.
+
+Compact mode
+------------
+The strategies accept ``compact=True`` to run on ``float32`` prices
+(:data:`COMPACT_DTYPE`) and return only the columns their signal needs,
+without copying the input frame. Relative to the ``float64`` results the
+rolling means, bands and channels agree within ``1e-6`` relative and RSI within
+``0.05`` points on BTC-scale prices. Signals can only differ on bars where
+the compared quantities are closer than ``float32`` resolution (about ``1e-7``
+relative), which is rare on real data.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Window end positions processed at once by the rolling max/min kernels,
+# bounding the size of their temporaries whatever the series length.
+_BLOCK = 1 << 16
+# Segment length of rolling_var: each segment is centred on its own mean, so
+# shorter segments keep the cumulative sums of squares more accurate.
+_VAR_SEGMENT = 1 << 13
+
+# Price dtype of the strategies' reduced-memory ("compact") mode.
+COMPACT_DTYPE = np.float32
+
+
+def as_float_array(values, dtype=None) -> np.ndarray:
+    """Return ``values`` as a floating NumPy array without copying if possible.
+
+    ``dtype`` forces a specific floating type, e.g. :data:`COMPACT_DTYPE`.
+    """
+    if dtype is not None:
+        return np.asarray(values, dtype=dtype)
+    array = np.asarray(values)
+    if not np.issubdtype(array.dtype, np.floating):
+        array = array.astype(np.float64)
+    return array
+
+
+def compact_dtype(compact: bool):
+    """Return the input dtype used by the strategies in ``compact`` mode."""
+    return COMPACT_DTYPE if compact else None
+
+
+def _check_window(window: int) -> None:
+    if window < 1:
+        raise ValueError("window must be a positive integer")
+
+
+def shift(values, periods: int = 1) -> np.ndarray:
+    """Shift ``values`` by ``periods`` positions, filling with ``NaN``."""
+    values = as_float_array(values)
+    out = np.full_like(values, np.nan)
+    if periods == 0:
+        out[:] = values
+    elif periods > 0:
+        out[periods:] = values[:-periods]
+    else:
+        out[:periods] = values[-periods:]
+    return out
+
+
+def diff(values) -> np.ndarray:
+    """First difference of ``values``; the first element is ``NaN``."""
+    values = as_float_array(values)
+    out = np.full_like(values, np.nan)
+    out[1:] = values[1:] - values[:-1]
+    return out
+
+
+def _window_sums(values: np.ndarray, window: int):
+    """Return rolling sums of ``values - ref`` and a mask of windows with NaNs."""
+    nan_mask = np.isnan(values)
+    has_nan = bool(nan_mask.any())
+    # Subtracting a reference keeps the running sum small and the differences
+    # of the cumulative sums accurate on long price series.
+    first = int(np.argmax(~nan_mask)) if has_nan else 0
+    ref = 0.0 if nan_mask[first] else float(values[first])
+    centered = values.astype(np.float64)
+    centered -= ref
+    if has_nan:
+        centered[nan_mask] = 0.0
+    csum = np.empty(len(values) + 1)
+    csum[0] = 0.0
+    np.cumsum(centered, out=csum[1:])
+    del centered
+    sums = csum[window:] - csum[:-window]
+    if not has_nan:
+        return sums, None, ref
+    cnan = np.concatenate(([0], np.cumsum(nan_mask, dtype=np.int64)))
+    return sums, (cnan[window:] - cnan[:-window]) > 0, ref
+
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    """Rolling mean computed from cumulative sums in O(n)."""
+    _check_window(window)
+    values = as_float_array(values)
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    if len(values) < window:
+        return out
+    sums, has_nan, ref = _window_sums(values, window)
+    sums /= window
+    sums += ref
+    if has_nan is not None:
+        sums[has_nan] = np.nan
+    out[window - 1:] = sums
+    return out
+
+
+def _segments(n: int, window: int, size: int):
+    """Yield ``(start, stop)`` ranges of window end positions, ``size`` at a time."""
+    size = max(size, window)
+    for start in range(window - 1, n, size):
+        yield start, min(start + size, n)
+
+
+def _rolling_extreme(values: np.ndarray, window: int, ufunc, fill: float) -> np.ndarray:
+    """Rolling ``ufunc`` (``np.maximum``/``np.minimum``) with the van Herk/Gil-Werman method.
+
+    Each segment is cut into blocks of ``window`` values; every window spans
+    the suffix of one block and the prefix of the next, so its extreme is
+    ``ufunc(suffix, prefix)`` of two block-wise scans. This costs three
+    comparisons per value whatever the window. ``NaN`` propagates through the
+    scans, so windows containing one are ``NaN`` as in pandas.
+    """
+    n = len(values)
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    for start, stop in _segments(n, window, _BLOCK):
+        segment = values[start - window + 1:stop]
+        length = len(segment)
+        blocks = np.empty((-(-length // window), window), dtype=values.dtype)
+        flat = blocks.reshape(-1)
+        flat[:length] = segment
+        flat[length:] = fill
+        suffix = np.empty_like(blocks)
+        ufunc.accumulate(blocks[:, ::-1], axis=1, out=suffix[:, ::-1])
+        ufunc.accumulate(blocks, axis=1, out=blocks)
+        ufunc(suffix.reshape(-1)[:stop - start], flat[window - 1:length], out=out[start:stop])
+    return out
+
+
+def rolling_var(values, window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling variance from shifted cumulative sums of ``x`` and ``x**2``.
+
+    The series is processed in segments of :data:`_VAR_SEGMENT` windows, each
+    centred on its own mean before the sums are taken. This keeps both the
+    cumulative sums and the ``sum(x**2) - sum(x)**2 / window`` difference
+    small, avoiding the cancellation of the plain formula on prices far from
+    zero while staying O(n).
+    """
+    _check_window(window)
+    values = as_float_array(values)
+    n = len(values)
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    if window - ddof <= 0:
+        return out
+    for start, stop in _segments(n, window, _VAR_SEGMENT):
+        centered = values[start - window + 1:stop].astype(np.float64)
+        nan_mask = np.isnan(centered)
+        has_nan = bool(nan_mask.any())
+        if has_nan:
+            if nan_mask.all():
+                continue
+            centered[nan_mask] = centered[~nan_mask].mean()
+        centered -= centered.mean()
+        sums = np.empty(len(centered) + 1)
+        sums[0] = 0.0
+        np.cumsum(centered, out=sums[1:])
+        first = sums[window:] - sums[:-window]
+        centered *= centered
+        np.cumsum(centered, out=sums[1:])
+        second = sums[window:] - sums[:-window]
+        first *= first
+        first /= window
+        second -= first
+        second /= window - ddof
+        np.maximum(second, 0.0, out=second)
+        if has_nan:
+            counts = np.concatenate(([0], np.cumsum(nan_mask, dtype=np.int64)))
+            second[(counts[window:] - counts[:-window]) > 0] = np.nan
+        out[start:stop] = second
+    return out
+
+
+def rolling_std(values, window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling standard deviation, see :func:`rolling_var`."""
+    return np.sqrt(rolling_var(values, window, ddof))
+
+
+def rolling_max(values, window: int) -> np.ndarray:
+    """Rolling maximum in O(n), see :func:`_rolling_extreme`."""
+    _check_window(window)
+    return _rolling_extreme(as_float_array(values), window, np.maximum, -np.inf)
+
+
+def rolling_min(values, window: int) -> np.ndarray:
+    """Rolling minimum in O(n), see :func:`_rolling_extreme`."""
+    _check_window(window)
+    return _rolling_extreme(as_float_array(values), window, np.minimum, np.inf)
+
+
+def rsi(values, period: int = 14) -> np.ndarray:
+    """Relative Strength Index with simple moving averages of gains and losses.
+
+    Matches ``mean_reversion.rsi``: the first difference counts as a zero
+    gain and loss, a window without losses yields ``100`` and a flat window
+    yields ``NaN``.
+    """
+    delta = diff(values)
+    with np.errstate(invalid="ignore"):
+        gain = np.where(delta > 0, delta, 0.0).astype(delta.dtype)
+        loss = np.where(delta < 0, -delta, 0.0).astype(delta.dtype)
+    avg_gain = rolling_mean(gain, period)
+    avg_loss = rolling_mean(loss, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
@@ -1,12 +1,161 @@
+import argparse
+import csv
+import json
 import sqlite3
+import sys
+import time
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+DEFAULT_DB_PATH = "str_one.db"
+DEFAULT_BATCH_SIZE = 50_000
+DEFAULT_CACHE_ENTRIES = 1024
+DEFAULT_CACHE_BYTES = 16 * 1024 * 1024
+DEFAULT_PAGE_SIZE = 100
+# Rows sampled by SearchCache to estimate the size of a result.
+_SIZE_SAMPLE = 256
+
+
+def iter_qa_file(path) -> Iterator[Tuple[str, str]]:
+    """Stream ``(domanda, risposta)`` pairs from a CSV or JSONL file.
+
+    CSV files must have a ``domanda,risposta`` header; JSONL files contain one
+    object per line with the same keys. Rows are yielded one at a time so the
+    file is never fully loaded in memory.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with path.open(encoding="utf-8", newline="") as handle:
+        if suffix in (".jsonl", ".ndjson"):
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                yield str(record["domanda"]), str(record["risposta"])
+        elif suffix == ".csv":
+            for record in csv.DictReader(handle):
+                yield record["domanda"], record["risposta"]
+        else:
+            raise ValueError(f"Unsupported file format: {path.suffix!r}")
+
+
+def normalizza_keyword(keyword: str) -> str:
+    """Return the cache key for ``keyword``.
+
+    ASCII keywords are lowercased, mirroring SQLite's ``LIKE`` which is
+    case-insensitive only for ASCII. Whitespace is kept: it is part of the
+    ``LIKE`` pattern, so ``" roma "`` and ``"roma"`` match different rows.
+    """
+    return keyword.lower() if keyword.isascii() else keyword
+
+
+class SearchCache:
+    """In-process LRU cache of search results with generation invalidation.
+
+    Entries are bounded both by count and by an estimate of their size in
+    bytes. Every write to the database must call :meth:`bump` so that entries
+    computed against an older generation are treated as misses. Writes made
+    by other processes are not detected.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[str, Tuple[int, int, tuple]]" = OrderedDict()
+
+    @staticmethod
+    def _sizeof(results, limit: int) -> int:
+        """Estimate the size of ``results`` from an evenly spaced sample of rows.
+
+        Sizing stops early once the sampled rows alone exceed ``limit``.
+        """
+        size = sys.getsizeof(results)
+        if not results:
+            return size
+        sample = results[::max(1, len(results) // _SIZE_SAMPLE)]
+        sampled = 0
+        for count, row in enumerate(sample, 1):
+            sampled += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+            if size + sampled > limit:
+                break
+        return size + sampled * len(results) // count
+
+    def bump(self) -> None:
+        """Invalidate every cached entry by advancing the generation."""
+        self.generation += 1
+
+    def _discard(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: str) -> Optional[list]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != self.generation:
+            if entry is not None:
+                self._discard(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(entry[2])
+
+    def put(self, key: str, results) -> None:
+        if self.max_entries <= 0:
+            return
+        if not isinstance(results, (list, tuple)):
+            results = tuple(results)
+        size = self._sizeof(results, self.max_bytes)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._discard(key)
+        self._entries[key] = (self.generation, size, tuple(results))
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current cache occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "generation": self.generation,
+        }
 
 
 class StrOneApp:
     """Application class for STR_ONE."""
 
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ):
+        self.db_path = db_path
+        self.cache = SearchCache(cache_entries, cache_bytes)
+
     def init_db(self):
         """Initialize the SQLite database and create the qa table."""
-        conn = sqlite3.connect("str_one.db")
+        conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -24,7 +173,7 @@ class StrOneApp:
         """Prompt the user for a question and answer and save them to the database."""
         domanda = input("Inserisci la domanda: ")
         risposta = input("Inserisci la risposta: ")
-        conn = sqlite3.connect("str_one.db")
+        conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute(
             "INSERT INTO qa (domanda, risposta) VALUES (?, ?)",
@@ -32,23 +181,143 @@ class StrOneApp:
         )
         conn.commit()
         conn.close()
+        self.cache.bump()
+
+    def importa_dati(
+        self,
+        righe: Iterable[Tuple[str, str]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict:
+        """Bulk insert ``(domanda, risposta)`` pairs from any iterable.
+
+        Rows are consumed lazily in batches of ``batch_size`` and written with
+        ``executemany``, one transaction per batch, so memory stays bounded by
+        the batch size regardless of the input length.
+
+        Returns a dictionary with ``rows``, ``seconds`` and ``rows_per_second``.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        self.init_db()
+        iterator = iter(righe)
+        totale = 0
+        start = time.perf_counter()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO qa (domanda, risposta) VALUES (?, ?)",
+                        batch,
+                    )
+                totale += len(batch)
+                self.cache.bump()
+        finally:
+            conn.close()
+        elapsed = time.perf_counter() - start
+        return {
+            "rows": totale,
+            "seconds": elapsed,
+            "rows_per_second": totale / elapsed if elapsed > 0 else float(totale),
+        }
+
+    def importa_file(self, path, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+        """Bulk import a CSV or JSONL file of QA pairs, see :meth:`importa_dati`."""
+        return self.importa_dati(iter_qa_file(path), batch_size=batch_size)
+
+    def cerca_risultati(self, keyword: str) -> list:
+        """Return ``(domanda, risposta)`` rows matching ``keyword``.
+
+        Results are served from :attr:`cache` when the same keyword (up to
+        ASCII case, see :func:`normalizza_keyword`) was searched since the
+        last write.
+        """
+        key = normalizza_keyword(keyword)
+        results = self.cache.get(key)
+        if results is not None:
+            return results
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            pattern = f"%{keyword}%"
+            results = conn.execute(
+                "SELECT domanda, risposta FROM qa WHERE domanda LIKE ? OR risposta LIKE ?",
+                (pattern, pattern),
+            ).fetchall()
+        finally:
+            conn.close()
+        self.cache.put(key, results)
+        return results
+
+    def cerca_pagina(
+        self,
+        keyword: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[int] = None,
+    ) -> dict:
+        """Return one keyset-paginated page of rows matching ``keyword``.
+
+        Rows are ``(id, domanda, risposta)`` tuples ordered by ``id``. Pass the
+        returned ``next_cursor`` back as ``cursor`` to fetch the following
+        page; it is ``None`` once the last page has been returned.
+        """
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = self._pagina(conn, keyword, limit + 1, cursor)
+        finally:
+            conn.close()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1][0]
+        return {"results": rows, "next_cursor": next_cursor}
+
+    def iter_risultati(self, keyword: str, page_size: int = DEFAULT_PAGE_SIZE * 10) -> Iterator[Tuple[int, str, str]]:
+        """Lazily yield ``(id, domanda, risposta)`` rows matching ``keyword``.
+
+        Rows are read one keyset page at a time, so memory stays bounded by
+        ``page_size`` however many rows match.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+
+        cursor = None
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                rows = self._pagina(conn, keyword, page_size, cursor)
+                yield from rows
+                if len(rows) < page_size:
+                    break
+                cursor = rows[-1][0]
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _pagina(conn, keyword: str, limit: int, cursor: Optional[int]) -> list:
+        pattern = f"%{keyword}%"
+        return conn.execute(
+            "SELECT id, domanda, risposta FROM qa "
+            "WHERE (domanda LIKE ? OR risposta LIKE ?) AND id > ? "
+            "ORDER BY id LIMIT ?",
+            (pattern, pattern, -1 if cursor is None else cursor, limit),
+        ).fetchall()
 
     def cerca(self, keyword):
         """Search the qa table for a keyword in domanda or risposta."""
-        conn = sqlite3.connect("str_one.db")
-        cursor = conn.cursor()
-        pattern = f"%{keyword}%"
-        cursor.execute(
-            "SELECT domanda, risposta FROM qa WHERE domanda LIKE ? OR risposta LIKE ?",
-            (pattern, pattern),
-        )
-        results = cursor.fetchall()
+        results = self.cerca_risultati(keyword)
         if results:
             for domanda, risposta in results:
                 print(f"Domanda: {domanda} - Risposta: {risposta}")
         else:
             print("Nessun risultato trovato")
-        conn.close()
 
     def run(self):
         self.init_db()
@@ -60,3 +329,35 @@ class StrOneApp:
             self.cerca(keyword)
         else:
             print("Operazione terminata")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="STR_ONE question/answer store")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database path")
+    subparsers = parser.add_subparsers(dest="command")
+    importa = subparsers.add_parser("import", help="Bulk import a CSV or JSONL file")
+    importa.add_argument("files", nargs="+", type=Path, help="Files to import")
+    importa.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per transaction",
+    )
+    args = parser.parse_args(argv)
+
+    app = StrOneApp(args.db)
+    if args.command != "import":
+        app.run()
+        return 0
+
+    for path in args.files:
+        stats = app.importa_file(path, batch_size=args.batch_size)
+        print(
+            f"{path}: {stats['rows']} righe importate in {stats['seconds']:.2f}s "
+            f"({stats['rows_per_second']:.0f} righe/s)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,14 @@ import logging
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+try:
+    from .profiling import bot_stage
+except ImportError:  # loaded as a standalone module, outside the package
+    from contextlib import nullcontext
+
+    def bot_stage(bot_id, stage):
+        return nullcontext()
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,23 +65,24 @@ class MetaNetManager:
             Dictionary containing ``asset``, ``score``, ``signal`` and
             ``confidence`` keys.
         """
-        if bot_id not in self.signals:
-            logger.warning("Unknown bot_id: %s", bot_id)
-            return
-
-        try:
-            signal = BotSignal(
-                asset=str(signal_dict["asset"]),
-                score=float(signal_dict.get("score", 0.0)),
-                signal=str(signal_dict.get("signal", "hold")),
-                confidence=float(signal_dict.get("confidence", 1.0)),
-            )
-        except KeyError as exc:
-            logger.error("Missing key in signal from %s: %s", bot_id, exc)
-            return
-
-        self.signals[bot_id] = signal
-        logger.info("Received signal from %s: %s", bot_id, signal_dict)
+        with bot_stage(bot_id, "ingest"):
+            if bot_id not in self.signals:
+                logger.warning("Unknown bot_id: %s", bot_id)
+                return
+
+            try:
+                signal = BotSignal(
+                    asset=str(signal_dict["asset"]),
+                    score=float(signal_dict.get("score", 0.0)),
+                    signal=str(signal_dict.get("signal", "hold")),
+                    confidence=float(signal_dict.get("confidence", 1.0)),
+                )
+            except KeyError as exc:
+                logger.error("Missing key in signal from %s: %s", bot_id, exc)
+                return
+
+            self.signals[bot_id] = signal
+            logger.info("Received signal from %s: %s", bot_id, signal_dict)
 
     def compute_global_signal(self) -> Dict[str, object]:
         """Compute the weighted average score and aggregated decision.
@@ -83,30 +92,31 @@ class MetaNetManager:
         Dict[str, object]
             Dictionary with ``weighted_score`` and ``aggregated_signal``.
         """
-        total_weight = 0.0
-        weighted_score = 0.0
-        decision_votes = {"buy": 0.0, "sell": 0.0, "hold": 0.0}
-
-        for bot_id, signal in self.signals.items():
-            if signal is None:
-                continue
-            w = signal.weight * signal.confidence
-            total_weight += w
-            weighted_score += signal.score * w
-            decision_votes[signal.signal] = decision_votes.get(signal.signal, 0.0) + w
-
-        if total_weight == 0.0:
-            result = {"weighted_score": 0.0, "aggregated_signal": "hold"}
-        else:
-            avg_score = weighted_score / total_weight
-            agg_signal = max(decision_votes, key=decision_votes.get)
-            result = {
-                "weighted_score": round(avg_score, 4),
-                "aggregated_signal": agg_signal,
-            }
-
-        logger.info("Computed global signal: %s", result)
-        return result
+        with bot_stage("metanet", "compute_global_signal"):
+            total_weight = 0.0
+            weighted_score = 0.0
+            decision_votes = {"buy": 0.0, "sell": 0.0, "hold": 0.0}
+
+            for bot_id, signal in self.signals.items():
+                if signal is None:
+                    continue
+                w = signal.weight * signal.confidence
+                total_weight += w
+                weighted_score += signal.score * w
+                decision_votes[signal.signal] = decision_votes.get(signal.signal, 0.0) + w
+
+            if total_weight == 0.0:
+                result = {"weighted_score": 0.0, "aggregated_signal": "hold"}
+            else:
+                avg_score = weighted_score / total_weight
+                agg_signal = max(decision_votes, key=decision_votes.get)
+                result = {
+                    "weighted_score": round(avg_score, 4),
+                    "aggregated_signal": agg_signal,
+                }
+
+            logger.info("Computed global signal: %s", result)
+            return result
 
 
 # Module-level manager instance
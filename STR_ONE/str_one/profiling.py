@@ -0,0 +1,198 @@
+"""Opt-in latency profiling for the ``on_new_data`` -> ``receive_signal`` path.
+
+Bots wrap their evaluation in :func:`bot_stage` and the strategy functions are
+decorated with :func:`profiled`. While profiling is disabled both reduce to a
+flag check. Once :func:`enable` is called every stage is timed and stored in a
+fixed-size ring buffer with its inclusive and self time, so nested stages
+(``on_new_data`` > ``generate_signal`` > ``apply_strategy``) can be told apart.
+``MetaNetManager`` times its own ``ingest`` and ``compute_global_signal``
+stages, which also covers signals arriving through ``str_one.server``.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_CAPACITY = 100_000
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Timing of one profiled stage."""
+
+    bot_id: str
+    path: Tuple[str, ...]
+    seconds: float
+    self_seconds: float
+
+    @property
+    def stage(self) -> str:
+        return self.path[-1]
+
+
+class _Frame:
+    __slots__ = ("bot_id", "path", "start", "children")
+
+    def __init__(self, bot_id: str, path: Tuple[str, ...]) -> None:
+        self.bot_id = bot_id
+        self.path = path
+        self.children = 0.0
+        self.start = time.perf_counter()
+
+
+class LatencyProfiler:
+    """Collect per-bot, per-stage timings in a ring buffer."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.enabled = False
+        self.records: Deque[StageTiming] = deque(maxlen=capacity)
+        self._local = threading.local()
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def _measure(self, bot_id: Optional[str], stage: str) -> Iterator[None]:
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        if bot_id is None:
+            bot_id = parent.bot_id if parent else "-"
+        frame = _Frame(bot_id, (parent.path if parent else ()) + (stage,))
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            stack.pop()
+            if parent is not None:
+                parent.children += elapsed
+            self.records.append(StageTiming(bot_id, frame.path, elapsed, elapsed - frame.children))
+
+    def stage(self, bot_id: Optional[str], stage: str):
+        """Return a context manager timing ``stage`` for ``bot_id``.
+
+        ``bot_id=None`` attributes the stage to the enclosing bot, if any.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(bot_id, stage)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    def summary(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Aggregate the buffer by ``(bot_id, stage)``.
+
+        Each entry holds ``count`` and the ``total_ms``, ``mean_ms``, ``max_ms``
+        and ``self_ms`` (total exclusive time) of the stage.
+        """
+        stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for record in list(self.records):
+            entry = stats.setdefault(
+                (record.bot_id, record.stage),
+                {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "self_ms": 0.0},
+            )
+            ms = record.seconds * 1000.0
+            entry["count"] += 1
+            entry["total_ms"] += ms
+            entry["self_ms"] += record.self_seconds * 1000.0
+            entry["max_ms"] = max(entry["max_ms"], ms)
+        for entry in stats.values():
+            entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        return stats
+
+    def slowest_bots(self, limit: int = 10, stage: str = "on_new_data") -> List[Tuple[str, Dict[str, float]]]:
+        """Return the ``limit`` bots with the highest worst-case ``stage`` time."""
+        rows = [(bot_id, entry) for (bot_id, name), entry in self.summary().items() if name == stage]
+        rows.sort(key=lambda row: row[1]["max_ms"], reverse=True)
+        return rows[:limit]
+
+    def collapsed_stacks(self) -> List[str]:
+        """Return the buffer in the collapsed-stack format used by flamegraph tools.
+
+        Each line is ``bot;stage;...;stage <self time in microseconds>``.
+        """
+        totals: Dict[Tuple[str, ...], float] = {}
+        for record in list(self.records):
+            key = (record.bot_id,) + record.path
+            totals[key] = totals.get(key, 0.0) + record.self_seconds
+        return [f"{';'.join(key)} {round(seconds * 1e6)}" for key, seconds in sorted(totals.items())]
+
+    def dump_collapsed(self, path) -> Path:
+        """Write :meth:`collapsed_stacks` to ``path`` (e.g. for ``flamegraph.pl``)."""
+        path = Path(path)
+        lines = self.collapsed_stacks()
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        return path
+
+
+# Module-level profiler instance
+_profiler = LatencyProfiler()
+
+
+def enable(capacity: Optional[int] = None) -> None:
+    """Start recording timings, optionally resizing the ring buffer."""
+    if capacity is not None:
+        _profiler.records = deque(_profiler.records, maxlen=capacity)
+    _profiler.enabled = True
+
+
+def disable() -> None:
+    """Stop recording timings; collected records are kept."""
+    _profiler.enabled = False
+
+
+def get_profiler() -> LatencyProfiler:
+    """Public API to obtain the module-level profiler."""
+    return _profiler
+
+
+def bot_stage(bot_id: Optional[str], stage: str):
+    """Time ``stage`` for ``bot_id`` on the module-level profiler."""
+    return _profiler.stage(bot_id, stage)
+
+
+def profiled(stage: str) -> Callable[[Callable], Callable]:
+    """Decorate a strategy function so its calls are timed as ``stage``.
+
+    Calls are attributed to the bot whose :func:`bot_stage` encloses them.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            with _profiler._measure(None, stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def capture_cprofile(path) -> Iterator[cProfile.Profile]:
+    """Run the enclosed block under :mod:`cProfile` and dump stats to ``path``.
+
+    The output can be opened with :mod:`pstats`, ``snakeviz`` or converted to
+    a flamegraph with ``flameprof``.
+    """
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        profile.dump_stats(str(path))
@@ -0,0 +1,282 @@
+"""Persistent, content-addressed cache of strategy results.
+
+Results of the ``apply_strategy`` functions are stored on disk under a key
+derived from a SHA-256 hash of the input columns (names, dtypes and raw bytes),
+the qualified name of the strategy, the code loaded from its module and its
+bound parameters. Editing and reloading a strategy module therefore
+invalidates its entries, while changes to shared helpers such as
+:mod:`str_one.indicators` need :meth:`ResultCache.clear`. Only the columns computed by the strategy are
+stored, as an uncompressed ``.npz`` file, so a hit loads in milliseconds and
+rebuilds the same DataFrame the strategy would return. The directory is
+bounded by ``max_bytes``: every hit refreshes the file's modification time
+and the least recently used files are evicted after each write.
+
+Example::
+
+    cache = ResultCache("~/.cache/str_one/results")
+    apply_cached = cache.wrap(trend_following.apply_strategy)
+    result = apply_cached(df, short_window=10)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import types
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "str_one" / "results"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when the key derivation or the file layout changes.
+_FORMAT_VERSION = 3
+_MODE_KEY = "__mode__"
+_COLUMNS_KEY = "__columns__"
+
+
+def _canonical(value):
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {"__dataclass__": type(value).__qualname__, **dataclasses.asdict(value)}
+    if isinstance(value, np.generic):
+        return value.item()
+    return repr(value)
+
+
+def _stable_repr(value) -> bytes:
+    # Set constants (e.g. from ``x in {"a", "b"}``) iterate in hash order,
+    # which changes between processes for strings.
+    if isinstance(value, frozenset):
+        return repr(sorted(map(repr, value))).encode()
+    return repr(value).encode()
+
+
+def _hash_code(code: types.CodeType, hasher) -> None:
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, hasher)
+        else:
+            hasher.update(_stable_repr(const))
+
+
+def _hash_function(func, hasher) -> None:
+    func = inspect.unwrap(func)
+    _hash_code(func.__code__, hasher)
+    hasher.update(repr((func.__defaults__, func.__kwdefaults__)).encode())
+
+
+def code_digest(func: Callable) -> str:
+    """Return a digest of the code ``func`` runs as currently loaded.
+
+    Covers the bytecode of ``func`` and of the functions, classes and simple
+    constants defined in its module, read from the live module namespace. An
+    edited strategy module therefore gets a new digest once it is reloaded
+    (e.g. with :func:`importlib.reload`), and a stale digest is never paired
+    with new code.
+    """
+    hasher = hashlib.sha256()
+    _hash_function(func, hasher)
+    module = inspect.unwrap(func).__module__
+    for name, value in sorted(inspect.unwrap(func).__globals__.items()):
+        if name.startswith("__"):
+            continue
+        if isinstance(value, (int, float, str, bytes, bool, tuple, frozenset)) or value is None:
+            hasher.update(name.encode() + _stable_repr(value))
+        elif getattr(value, "__module__", None) != module:
+            continue
+        elif isinstance(value, types.FunctionType):
+            hasher.update(name.encode())
+            _hash_function(value, hasher)
+        elif isinstance(value, type):
+            hasher.update(name.encode())
+            for attr, member in sorted(vars(value).items()):
+                member = getattr(member, "__func__", member)
+                if isinstance(member, types.FunctionType):
+                    hasher.update(attr.encode())
+                    _hash_function(member, hasher)
+                elif isinstance(member, (int, float, str, bool, tuple)) and not attr.startswith("__"):
+                    hasher.update(repr((attr, member)).encode())
+    return hasher.hexdigest()
+
+
+def hash_frame(df: pd.DataFrame, hasher=None):
+    """Feed the column names, dtypes and values of ``df`` to a SHA-256 hasher.
+
+    SHA-256 is hardware accelerated on current CPUs.
+    """
+    hasher = hasher or hashlib.sha256()
+    hasher.update(repr(len(df)).encode())
+    for name in df.columns:
+        values = df[name].to_numpy()
+        if values.dtype == object:
+            values = pd.util.hash_pandas_object(df[name], index=False).to_numpy()
+        hasher.update(repr((str(name), values.dtype.str)).encode())
+        if values.dtype.kind in "mM":
+            # datetime64/timedelta64 do not support the buffer protocol.
+            values = values.view("i8")
+        hasher.update(memoryview(np.ascontiguousarray(values)).cast("B"))
+    return hasher
+
+
+def result_key(strategy: str, df: pd.DataFrame, params: Dict[str, object], code: str = "") -> str:
+    """Return the cache key of ``strategy`` applied to ``df`` with ``params``.
+
+    ``code`` identifies the strategy implementation, see :func:`code_digest`.
+    """
+    hasher = hashlib.sha256()
+    header = json.dumps([_FORMAT_VERSION, strategy, code, params], sort_keys=True, default=_canonical)
+    hasher.update(header.encode("utf-8"))
+    return hash_frame(df, hasher).hexdigest()
+
+
+class ResultCache:
+    """Size-bounded directory of strategy results keyed by content hash.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Where the ``.npz`` files are kept; created on first use.
+    max_bytes : int, optional
+        Upper bound of the total size of the cached files.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def load(self, key: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Rebuild the cached result of ``key`` on top of ``df``, or return ``None``."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                mode = str(stored[_MODE_KEY])
+                names = [str(name) for name in stored[_COLUMNS_KEY]]
+                columns = {name: stored[name] for name in names}
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        if mode == "assign":
+            return df.assign(**columns)
+        return pd.DataFrame(columns, index=df.index)
+
+    def store(self, key: str, df: pd.DataFrame, result: pd.DataFrame) -> bool:
+        """Store the columns ``result`` adds to or changes in ``df``; return whether it was cached.
+
+        Results holding object columns, or larger than ``max_bytes``, are not
+        cached.
+        """
+        if set(df.columns) <= set(result.columns):
+            # Input columns the strategy overwrote (e.g. ``signal`` when it is
+            # applied to its own output) are stored along with the new ones.
+            names = [
+                name for name in result.columns
+                if name not in df.columns or not result[name].equals(df[name])
+            ]
+            mode = "assign"
+        else:
+            mode, names = "frame", list(result.columns)
+        arrays = {str(name): result[name].to_numpy() for name in names}
+        if any(array.dtype == object for array in arrays.values()):
+            return False
+        if sum(array.nbytes for array in arrays.values()) > self.max_bytes:
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(handle, **{_MODE_KEY: np.array(mode), _COLUMNS_KEY: np.array(list(arrays))}, **arrays)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            _unlink_quietly(tmp_path)
+            raise
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """Delete the least recently used files above ``max_bytes``; return how many."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".npz") and entry.is_file():
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                        total += stat.st_size
+        except FileNotFoundError:
+            return 0
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _unlink_quietly(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        if self.directory.is_dir():
+            for path in self.directory.glob("*.npz"):
+                _unlink_quietly(path)
+
+    def stats(self) -> Dict[str, int]:
+        files = list(self.directory.glob("*.npz")) if self.directory.is_dir() else []
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "files": len(files),
+            "bytes": sum(path.stat().st_size for path in files),
+        }
+
+    def apply(self, func: Callable[..., pd.DataFrame], df: pd.DataFrame, *args, **kwargs) -> pd.DataFrame:
+        """Return ``func(df, *args, **kwargs)``, loading it from disk when cached."""
+        bound = inspect.signature(func).bind(df, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        params.pop(next(iter(params)))
+        strategy = f"{func.__module__}.{func.__qualname__}"
+
+        key = result_key(strategy, df, params, code_digest(func))
+        result = self.load(key, df)
+        if result is None:
+            result = func(df, *args, **kwargs)
+            self.store(key, df, result)
+        return result
+
+    def wrap(self, func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        """Return a memoized version of the strategy function ``func``."""
+
+        @functools.wraps(func)
+        def wrapper(df: pd.DataFrame, *args, **kwargs) -> pd.DataFrame:
+            return self.apply(func, df, *args, **kwargs)
+
+        return wrapper
+
+
+def _unlink_quietly(path) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
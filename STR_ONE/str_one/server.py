@@ -0,0 +1,320 @@
+"""Socket front end letting out-of-process bots feed ``MetaNetManager``.
+
+The server runs on asyncio and listens on a Unix socket or a TCP port. Every
+message is a frame made of a 4-byte big-endian length followed by a UTF-8
+JSON object. Requests carry an ``op`` field:
+
+* ``{"op": "signals", "signals": [[bot_id, signal_dict], ...]}`` applies a
+  batch of signals and replies ``{"ok": true, "accepted": n, "rejected":
+  [[index, reason], ...]}``; invalid entries are skipped one by one;
+* ``{"op": "global"}`` replies ``{"ok": true, "result": {...}}`` with the
+  output of ``compute_global_signal``;
+* ``{"op": "reset"}`` resets every signal.
+
+Replies are written in request order, so clients can pipeline several
+requests on one connection before reading the replies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import queue
+import socket
+import struct
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import metanet_manager
+from .metanet_manager import MetaNetManager
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+# Requests a client sends before reading their replies. Unread replies pile
+# up in the socket buffers, so an unbounded pipeline would eventually stall
+# the server's writes and, in turn, the client's sends.
+PIPELINE_WINDOW = 256
+
+Signal = Tuple[str, Dict[str, object]]
+
+
+def encode_frame(message: Dict[str, object]) -> bytes:
+    """Serialize ``message`` as a length-prefixed JSON frame."""
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {len(payload)} bytes exceeds {MAX_FRAME_SIZE}")
+    return HEADER.pack(len(payload)) + payload
+
+
+class MetaNetServer:
+    """Asyncio server applying signal batches to a ``MetaNetManager``.
+
+    Parameters
+    ----------
+    manager : MetaNetManager, optional
+        Manager receiving the signals; defaults to the module-level one.
+    """
+
+    def __init__(self, manager: Optional[MetaNetManager] = None) -> None:
+        self.manager = manager or metanet_manager._manager
+        self.received = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: set = set()
+
+    def _check_entry(self, entry) -> Optional[str]:
+        """Return why a ``[bot_id, signal_dict]`` entry would be rejected, if it would."""
+        try:
+            bot_id, signal = entry
+        except (TypeError, ValueError):
+            return "entry must be a [bot_id, signal] pair"
+        if not isinstance(bot_id, str) or bot_id not in self.manager.signals:
+            return f"unknown bot_id: {bot_id!r}"
+        if not isinstance(signal, dict) or "asset" not in signal:
+            return "signal must be an object with an 'asset' key"
+        try:
+            float(signal.get("score", 0.0))
+            float(signal.get("confidence", 1.0))
+        except (TypeError, ValueError):
+            return "score and confidence must be numbers"
+        return None
+
+    def handle(self, request: Dict[str, object]) -> Dict[str, object]:
+        """Apply one decoded request to the manager and return the reply."""
+        op = request.get("op")
+        if op == "signals":
+            entries = request.get("signals", [])
+            if not isinstance(entries, list):
+                return {"ok": False, "error": "signals must be a list"}
+            accepted = 0
+            rejected = []
+            for index, entry in enumerate(entries):
+                reason = self._check_entry(entry)
+                if reason is not None:
+                    rejected.append([index, reason])
+                    continue
+                self.manager.receive_signal(*entry)
+                accepted += 1
+            self.received += accepted
+            return {"ok": True, "accepted": accepted, "rejected": rejected}
+        if op == "global":
+            return {"ok": True, "result": self.manager.compute_global_signal()}
+        if op == "reset":
+            self.manager.reset_signals()
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown op: {op!r}"}
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+                (size,) = HEADER.unpack(header)
+                if size > MAX_FRAME_SIZE:
+                    logger.warning("Closing connection: frame of %d bytes is too large", size)
+                    break
+                payload = await reader.readexactly(size)
+                try:
+                    reply = self.handle(json.loads(payload))
+                except (ValueError, TypeError, AttributeError) as exc:
+                    reply = {"ok": False, "error": str(exc)}
+                # drain() only waits when the transport buffer is above its
+                # high-water mark, so pipelined replies are not serialized.
+                writer.write(encode_frame(reply))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by aclose(); returning normally keeps asyncio's stream
+            # callback from logging the cancellation as an error.
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def start(self, host: Optional[str] = None, port: Optional[int] = None, path: Optional[str] = None):
+        """Start listening on ``path`` (Unix socket) or ``host:port`` (TCP)."""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve_connection, path=path)
+        else:
+            self._server = await asyncio.start_server(self._serve_connection, host or "127.0.0.1", port or 0)
+        logger.info("MetaNet server listening on %s", self.address)
+        return self._server
+
+    @property
+    def address(self):
+        """Bound address: a path for Unix sockets, ``(host, port)`` for TCP."""
+        if self._server is None:
+            return None
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def aclose(self) -> None:
+        """Stop listening and cancel the open connections."""
+        if self._server is not None:
+            self._server.close()
+        connections = list(self._connections)
+        for task in connections:
+            task.cancel()
+        await asyncio.gather(*connections, return_exceptions=True)
+
+
+@contextmanager
+def serve_in_thread(
+    manager: Optional[MetaNetManager] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    path: Optional[str] = None,
+) -> Iterator[MetaNetServer]:
+    """Run a :class:`MetaNetServer` on a background event loop thread."""
+    server = MetaNetServer(manager)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="metanet-server", daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(host, port, path), loop).result()
+    try:
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            raise ConnectionError("MetaNet server closed the connection")
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+class _Connection:
+    def __init__(self, address) -> None:
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(address)
+        if family == socket.AF_INET:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def pipeline(self, requests: Sequence[Dict[str, object]]) -> List[Dict[str, object]]:
+        replies = []
+        for start in range(0, len(requests), PIPELINE_WINDOW):
+            window = requests[start:start + PIPELINE_WINDOW]
+            self.sock.sendall(b"".join(encode_frame(request) for request in window))
+            for _ in window:
+                (size,) = HEADER.unpack(_recv_exactly(self.sock, HEADER.size))
+                replies.append(json.loads(_recv_exactly(self.sock, size)))
+        return replies
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class MetaNetClient:
+    """Blocking client with a pool of connections to a :class:`MetaNetServer`.
+
+    Parameters
+    ----------
+    address : str or tuple
+        Unix socket path or ``(host, port)``.
+    pool_size : int, optional
+        Maximum number of open connections shared by the calling threads.
+    """
+
+    def __init__(self, address, pool_size: int = 4) -> None:
+        self.address = address if isinstance(address, str) else tuple(address)
+        self._pool: "queue.LifoQueue[_Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    @contextmanager
+    def _connection(self) -> Iterator[_Connection]:
+        with self._slots:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = _Connection(self.address)
+            try:
+                yield conn
+            except BaseException:
+                conn.close()
+                raise
+            self._pool.put(conn)
+
+    def pipeline(self, requests: Sequence[Dict[str, object]]) -> List[Dict[str, object]]:
+        """Send the requests on one connection and return the replies in order.
+
+        Requests are written in windows of :data:`PIPELINE_WINDOW`, reading
+        the replies of each window before sending the next one.
+        """
+        with self._connection() as conn:
+            return conn.pipeline(requests)
+
+    def send_signals(self, signals: Iterable[Signal]) -> int:
+        """Send one batch of ``(bot_id, signal_dict)`` pairs; return how many were accepted."""
+        return self.pipeline([{"op": "signals", "signals": list(signals)}])[0]["accepted"]
+
+    def send_batches(self, batches: Iterable[Iterable[Signal]]) -> int:
+        """Pipeline several signal batches on one connection."""
+        requests = [{"op": "signals", "signals": list(batch)} for batch in batches]
+        return sum(reply["accepted"] for reply in self.pipeline(requests))
+
+    def global_signal(self) -> Dict[str, object]:
+        """Return the manager's current ``compute_global_signal`` result."""
+        return self.pipeline([{"op": "global"}])[0]["result"]
+
+    def reset(self) -> None:
+        self.pipeline([{"op": "reset"}])
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> "MetaNetClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the module-level MetaNetManager over a socket")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--unix", help="Unix socket path")
+    group.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    async def run() -> None:
+        server = MetaNetServer()
+        await server.start(args.host, args.port, args.unix)
+        print(f"MetaNet server in ascolto su {server.address}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
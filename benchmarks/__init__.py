@@ -0,0 +1 @@
+"""Reproducible offline benchmarks for META_NET and STR_ONE."""
@@ -0,0 +1,56 @@
+"""Seeded synthetic data generators used by the benchmarks."""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, Iterator, List, Tuple
+
+WORDS = (
+    "mercato prezzo segnale rischio trend volume ordine posizione capitale "
+    "strategia indicatore media banda rottura ritorno volatilita portafoglio"
+).split()
+
+
+def synthetic_ohlcv(n_bars: int, seed: int = 0, start_price: float = 100.0):
+    """Return a reproducible OHLCV ``DataFrame`` following a random walk."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0, 0.002, n_bars)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([start_price], close[:-1]))
+    spread = np.abs(rng.normal(0.0, 0.001, n_bars)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(10.0, 1.0, n_bars)
+    return pd.DataFrame({"open": open_, "high": high, "low": low, "close": close, "volume": volume})
+
+
+def synthetic_signals(n_bots: int, seed: int = 0) -> Dict[str, Dict[str, object]]:
+    """Return ``n_bots`` reproducible signal dictionaries keyed by bot id."""
+    rng = random.Random(seed)
+    return {
+        f"bot_{i:02d}": {
+            "asset": "BTCUSD",
+            "score": rng.uniform(-1.0, 1.0),
+            "signal": rng.choice(("buy", "sell", "hold")),
+            "confidence": rng.random(),
+        }
+        for i in range(1, n_bots + 1)
+    }
+
+
+def synthetic_qa(n_rows: int, seed: int = 0) -> Iterator[Tuple[str, str]]:
+    """Yield ``n_rows`` reproducible ``(domanda, risposta)`` pairs."""
+    rng = random.Random(seed)
+    for i in range(n_rows):
+        domanda = " ".join(rng.choices(WORDS, k=6)) + f" {i}?"
+        risposta = " ".join(rng.choices(WORDS, k=12))
+        yield domanda, risposta
+
+
+def qa_keywords(count: int, seed: int = 0) -> List[str]:
+    """Return ``count`` reproducible search keywords drawn from ``WORDS``."""
+    rng = random.Random(seed)
+    return [rng.choice(WORDS) for _ in range(count)]
@@ -0,0 +1,146 @@
+"""Timing, statistics and baseline comparison helpers for the benchmarks.
+
+Only the standard library is used here so results can be compared without
+the numerical dependencies installed.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    """Summary of one benchmark case."""
+
+    name: str
+    size: int
+    repeat: int
+    p50_ms: float
+    max_ms: float
+    throughput: float
+    unit: str
+    peak_bytes: Optional[int] = None
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``samples`` with linear interpolation."""
+    if not samples:
+        raise ValueError("percentile of an empty sample")
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    size: int,
+    unit: str,
+    repeat: int = 5,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """Time ``func`` ``repeat`` times and summarize the latencies.
+
+    ``size`` is the number of ``unit`` items processed per call and is used to
+    derive the throughput from the median latency. The worst sample is
+    reported as ``max_ms``: with a few repeats a high percentile would only
+    be the maximum under another name.
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    p50 = percentile(samples, 50)
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        repeat=repeat,
+        p50_ms=p50 * 1000.0,
+        max_ms=max(samples) * 1000.0,
+        throughput=size / p50 if p50 > 0 else float("inf"),
+        unit=unit,
+    )
+
+
+def measure_peak_memory(name: str, func: Callable[[], object], size: int, unit: str) -> BenchmarkResult:
+    """Run ``func`` once under :mod:`tracemalloc` and record its peak allocation.
+
+    NumPy and pandas buffers are reported to ``tracemalloc``, so the peak
+    covers the arrays and frames created by the call. The call is also timed,
+    although tracing makes it slower than in :func:`measure`.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        repeat=1,
+        p50_ms=elapsed * 1000.0,
+        max_ms=elapsed * 1000.0,
+        throughput=size / elapsed if elapsed > 0 else float("inf"),
+        unit=unit,
+        peak_bytes=peak,
+    )
+
+
+def to_report(results: List[BenchmarkResult], profile: str) -> Dict[str, object]:
+    """Build the JSON-serializable report for ``results``."""
+    return {
+        "profile": profile,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def load_report(path: Path) -> Optional[Dict[str, object]]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def compare_to_baseline(
+    report: Dict[str, object],
+    baseline: Dict[str, object],
+    threshold: float = 0.25,
+) -> List[Dict[str, object]]:
+    """Return the cases whose median latency regressed beyond ``threshold``.
+
+    Cases are matched on ``(name, size)``; cases missing from the baseline are
+    ignored. A ``threshold`` of ``0.25`` flags anything more than 25% slower.
+    """
+    reference = {(case["name"], case["size"]): case for case in baseline.get("results", [])}
+    regressions = []
+    for case in report.get("results", []):
+        base = reference.get((case["name"], case["size"]))
+        if base is None or base["p50_ms"] <= 0:
+            continue
+        ratio = case["p50_ms"] / base["p50_ms"]
+        if ratio > 1.0 + threshold:
+            regressions.append({
+                "name": case["name"],
+                "size": case["size"],
+                "baseline_p50_ms": base["p50_ms"],
+                "p50_ms": case["p50_ms"],
+                "ratio": round(ratio, 3),
+            })
+    return regressions
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""Run the offline benchmark suite and compare it with a stored baseline.
+
+Examples::
+
+    python benchmarks/run.py --profile quick --output bench.json
+    python benchmarks/run.py --profile quick --baseline benchmarks/baseline.json
+    python benchmarks/run.py --profile quick --save-baseline benchmarks/baseline.json
+
+The process exits with status 1 when a case is slower than the baseline by
+more than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for package_dir in (REPO_ROOT, REPO_ROOT / "STR_ONE", REPO_ROOT / "META_NET"):
+    if str(package_dir) not in sys.path:
+        sys.path.insert(0, str(package_dir))
+
+from benchmarks import data  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    BenchmarkResult,
+    compare_to_baseline,
+    load_report,
+    measure,
+    measure_peak_memory,
+    to_report,
+)
+
+PROFILES: Dict[str, Dict[str, object]] = {
+    "quick": {
+        "bars": [1_000, 10_000],
+        "bots": [99, 1_000],
+        "rows": [10_000],
+        "days": [1_000],
+        "clients": [1, 4],
+        "repeat": 50,
+    },
+    "full": {
+        "bars": [1_000, 100_000, 1_000_000],
+        "bots": [99, 10_000, 100_000],
+        "rows": [10_000, 100_000, 1_000_000],
+        "days": [1_000, 100_000],
+        "clients": [1, 4, 16],
+        "repeat": 20,
+    },
+}
+
+
+def bench_bots(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from str_one.bots import (
+        apply_breakout_strategy,
+        apply_btc4h5m_strategy,
+        apply_grid_range_strategy,
+        apply_mean_reversion_strategy,
+        apply_strategy,
+    )
+
+    strategies: Dict[str, Callable] = {
+        "bots.trend_following.apply_strategy": apply_strategy,
+        "bots.breakout_strategy.apply_strategy": apply_breakout_strategy,
+        "bots.mean_reversion.apply_strategy": apply_mean_reversion_strategy,
+        "bots.btc4h5m.apply_strategy": apply_btc4h5m_strategy,
+        "bots.grid_range.apply_strategy": apply_grid_range_strategy,
+    }
+    results = []
+    for n_bars in profile["bars"]:
+        df = data.synthetic_ohlcv(n_bars, seed)
+        for name, func in strategies.items():
+            results.append(measure(name, lambda: func(df), n_bars, "bars", profile["repeat"]))
+    return results
+
+
+def bench_indicators(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from str_one import indicators
+
+    results = []
+    for n_bars in profile["bars"]:
+        close = data.synthetic_ohlcv(n_bars, seed)["close"]
+        values = close.to_numpy()
+        for window in (20, 100):
+            cases: Dict[str, Callable] = {
+                "indicators.rolling_mean": lambda: indicators.rolling_mean(values, window),
+                "pandas.rolling_mean": lambda: close.rolling(window).mean(),
+                "indicators.rolling_max": lambda: indicators.rolling_max(values, window),
+                "pandas.rolling_max": lambda: close.rolling(window).max(),
+                "indicators.rolling_std": lambda: indicators.rolling_std(values, window),
+                "pandas.rolling_std": lambda: close.rolling(window).std(),
+            }
+            for name, func in cases.items():
+                results.append(measure(f"{name}[window={window}]", func, n_bars, "bars", profile["repeat"]))
+    return results
+
+
+def bench_memory(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from str_one.bots import (
+        apply_breakout_strategy,
+        apply_mean_reversion_strategy,
+        apply_strategy,
+    )
+
+    strategies: Dict[str, Callable] = {
+        "bots.trend_following.apply_strategy": apply_strategy,
+        "bots.breakout_strategy.apply_strategy": apply_breakout_strategy,
+        "bots.mean_reversion.apply_strategy": apply_mean_reversion_strategy,
+    }
+    results = []
+    for n_bars in profile["bars"]:
+        df = data.synthetic_ohlcv(n_bars, seed)
+        for name, func in strategies.items():
+            results.append(measure_peak_memory(f"{name}[peak]", lambda: func(df), n_bars, "bars"))
+            results.append(
+                measure_peak_memory(f"{name}[peak,compact]", lambda: func(df, compact=True), n_bars, "bars")
+            )
+    return results
+
+
+def bench_cache(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from str_one.bots import apply_btc4h5m_strategy, apply_strategy
+    from str_one.result_cache import ResultCache
+
+    strategies: Dict[str, Callable] = {
+        "bots.trend_following.apply_strategy": apply_strategy,
+        "bots.btc4h5m.apply_strategy": apply_btc4h5m_strategy,
+    }
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(tmp)
+        for n_bars in profile["bars"]:
+            df = data.synthetic_ohlcv(n_bars, seed)
+            for name, func in strategies.items():
+                # The warm-up call stores the result; the timed calls are hits.
+                results.append(
+                    measure(f"{name}[cached]", lambda: cache.apply(func, df), n_bars, "bars", profile["repeat"])
+                )
+    return results
+
+
+def bench_manager(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from str_one.metanet_manager import MetaNetManager
+
+    results = []
+    for n_bots in profile["bots"]:
+        signals = data.synthetic_signals(n_bots, seed)
+        manager = MetaNetManager()
+        # The manager pre-registers 99 slots; larger sizes register extra ids.
+        for bot_id in signals:
+            manager.signals.setdefault(bot_id, None)
+        manager.bot_ids = list(manager.signals)
+
+        def ingest() -> None:
+            for bot_id, signal in signals.items():
+                manager.receive_signal(bot_id, signal)
+
+        results.append(measure("manager.receive_signal", ingest, n_bots, "signals", profile["repeat"]))
+        results.append(
+            measure("manager.compute_global_signal", manager.compute_global_signal, n_bots, "bots", profile["repeat"])
+        )
+    return results
+
+
+# Signals sent by every client process per measured call of the server suite.
+SERVER_SIGNALS_PER_CLIENT = 20_000
+SERVER_BATCH_SIZE = 100
+
+
+def _push_signals(args) -> int:
+    """Client process of the server suite: pipeline batches of signals."""
+    from str_one.server import MetaNetClient
+
+    address, seed = args
+    signals = list(data.synthetic_signals(99, seed).items())
+    batches = [
+        [signals[(start + i) % len(signals)] for i in range(SERVER_BATCH_SIZE)]
+        for start in range(0, SERVER_SIGNALS_PER_CLIENT, SERVER_BATCH_SIZE)
+    ]
+    with MetaNetClient(address, pool_size=1) as client:
+        return client.send_batches(batches)
+
+
+def bench_server(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from str_one.metanet_manager import MetaNetManager
+    from str_one.server import serve_in_thread
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, serve_in_thread(
+        MetaNetManager(), path=os.path.join(tmp, "metanet.sock")
+    ) as server:
+        for n_clients in profile["clients"]:
+            # The worker processes are started once, outside the timed calls.
+            with multiprocessing.get_context("spawn").Pool(n_clients) as pool:
+                jobs = [(server.address, seed + i) for i in range(n_clients)]
+                results.append(
+                    measure(
+                        f"server.signals[clients={n_clients}]",
+                        lambda: pool.map(_push_signals, jobs),
+                        n_clients * SERVER_SIGNALS_PER_CLIENT,
+                        "signals",
+                        repeat=3,
+                    )
+                )
+    return results
+
+
+def bench_trader(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from meta_net import MetaNetTrader
+
+    trader = MetaNetTrader(R=1.0, C=1.0, F=0.1, M=0.1)
+    results = []
+    for days in profile["days"]:
+        def backtest() -> None:
+            random.seed(seed)
+            with contextlib.redirect_stdout(io.StringIO()):
+                trader.backtest(giorni=days, num_indicatori=5)
+
+        results.append(measure("trader.backtest", backtest, days, "days", profile["repeat"]))
+    return results
+
+
+def bench_sqlite(profile: Dict[str, object], seed: int) -> List[BenchmarkResult]:
+    from str_one.main import StrOneApp
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in profile["rows"]:
+            counter = itertools.count()
+
+            def bulk_import() -> None:
+                app = StrOneApp(str(Path(tmp) / f"import_{n_rows}_{next(counter)}.db"))
+                app.importa_dati(data.synthetic_qa(n_rows, seed))
+
+            results.append(measure("strone.importa_dati", bulk_import, n_rows, "rows", repeat=3, warmup=0))
+
+            # The result cache is disabled so every call measures the SQL scan.
+            app = StrOneApp(str(Path(tmp) / f"search_{n_rows}.db"), cache_entries=0)
+            app.importa_dati(data.synthetic_qa(n_rows, seed))
+            keywords = itertools.cycle(data.qa_keywords(64, seed))
+            results.append(
+                measure(
+                    "strone.cerca",
+                    lambda: app.cerca_risultati(next(keywords)),
+                    n_rows,
+                    "rows",
+                    profile["repeat"],
+                )
+            )
+    return results
+
+
+SUITES = {
+    "bots": bench_bots,
+    "indicators": bench_indicators,
+    "memory": bench_memory,
+    "cache": bench_cache,
+    "manager": bench_manager,
+    "server": bench_server,
+    "trader": bench_trader,
+    "sqlite": bench_sqlite,
+}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick", help="Input sizes to run")
+    parser.add_argument("--suite", choices=sorted(SUITES), action="append", help="Suites to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data generators")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this path instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed p50 slowdown (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", type=Path, help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    profile = PROFILES[args.profile]
+    results: List[BenchmarkResult] = []
+    for suite in args.suite or list(SUITES):
+        results.extend(SUITES[suite](profile, args.seed))
+        print(f"Completed suite {suite}", file=sys.stderr)
+
+    report = to_report(results, args.profile)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.save_baseline:
+        args.save_baseline.write_text(text + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = load_report(args.baseline)
+        if baseline is None:
+            print(f"Baseline {args.baseline} not found; skipping comparison", file=sys.stderr)
+            return 0
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['name']}[{regression['size']}]: "
+                f"{regression['p50_ms']:.3f} ms vs {regression['baseline_p50_ms']:.3f} ms "
+                f"(x{regression['ratio']})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,25 @@
+"""Helpers shared by the test modules."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def synthetic_prices(n=2000, seed=3, start_price=30_000.0):
+    """Seeded OHLCV random walk from :mod:`benchmarks.data` at BTC-like prices."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    from benchmarks import data
+
+    return data.synthetic_ohlcv(n, seed, start_price)
+
+
+class RecordingManager:
+    """Stand-in for ``MetaNetManager`` that records the signals it receives."""
+
+    def __init__(self):
+        self.received = []
+
+    def receive_signal(self, bot_id, signal):
+        self.received.append((bot_id, signal))
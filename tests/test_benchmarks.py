@@ -0,0 +1,41 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks import data  # noqa: E402
+from benchmarks.harness import compare_to_baseline, measure, percentile, to_report  # noqa: E402
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_percentile_interpolates(self):
+        samples = [4.0, 1.0, 3.0, 2.0]
+        self.assertEqual(2.5, percentile(samples, 50))
+        self.assertEqual(4.0, percentile(samples, 100))
+        self.assertAlmostEqual(3.97, percentile(samples, 99))
+
+    def test_compare_flags_only_regressions_beyond_threshold(self):
+        baseline = {'results': [
+            {'name': 'fast', 'size': 10, 'p50_ms': 1.0},
+            {'name': 'slow', 'size': 10, 'p50_ms': 1.0},
+        ]}
+        report = to_report([
+            measure('fast', lambda: None, 10, 'items', repeat=3),
+        ], 'quick')
+        report['results'].append({'name': 'slow', 'size': 10, 'p50_ms': 1.5})
+        report['results'].append({'name': 'new', 'size': 10, 'p50_ms': 9.0})
+
+        regressions = compare_to_baseline(report, baseline, threshold=0.25)
+
+        self.assertEqual([('slow', 10)], [(r['name'], r['size']) for r in regressions])
+        self.assertEqual(1.5, regressions[0]['ratio'])
+
+    def test_generators_are_seeded(self):
+        self.assertEqual(list(data.synthetic_qa(5, seed=3)), list(data.synthetic_qa(5, seed=3)))
+        self.assertNotEqual(list(data.synthetic_qa(5, seed=3)), list(data.synthetic_qa(5, seed=4)))
+        self.assertEqual(data.synthetic_signals(99, seed=1), data.synthetic_signals(99, seed=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
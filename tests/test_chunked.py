@@ -0,0 +1,73 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from support import synthetic_prices
+
+try:
+    import numpy as np
+    import pandas as pd
+    import ta  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependencies
+    np = pd = None
+
+STR_ONE_PATH = Path(__file__).resolve().parents[1] / 'STR_ONE'
+
+
+def import_chunked():
+    sys.path.insert(0, str(STR_ONE_PATH))
+    try:
+        from str_one import bots, chunked
+    finally:
+        sys.path.remove(str(STR_ONE_PATH))
+    return bots, chunked
+
+
+def split(df, parts):
+    bounds = np.linspace(0, len(df), parts + 1).astype(int)
+    return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+@unittest.skipIf(np is None, 'numpy, pandas and ta are required')
+class TestChunkedBacktest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bots, cls.chunked = import_chunked()
+
+    def test_chunked_file_matches_in_memory_run(self):
+        df = synthetic_prices(n=3000, seed=5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'ohlcv.csv'
+            df.to_csv(path, index=False)
+            for strategy in sorted(self.chunked.STRATEGIES):
+                with self.subTest(strategy=strategy):
+                    expected = self.chunked.backtest_frame(pd.read_csv(path), strategy)
+                    chunks = list(self.chunked.backtest_file(path, strategy, chunksize=257))
+                    result = pd.concat(chunks)
+
+                    self.assertEqual(12, len(chunks))
+                    np.testing.assert_array_equal(expected['signal'], result['signal'])
+                    np.testing.assert_array_equal(expected['position'], result['position'])
+                    np.testing.assert_allclose(expected['equity'], result['equity'], rtol=1e-9)
+
+    def test_stateful_strategies_are_bit_identical_to_apply_strategy(self):
+        df = synthetic_prices(n=3000, seed=5)
+        expected = self.bots.apply_btc4h5m_strategy(df)
+        state = self.bots.btc4h5m.BTC4H5MState()
+        parts = [state.update(c['high'], c['low'], c['close']) for c in split(df, 7)]
+
+        for column in ['atr', 'rsi', 'ema20', 'ema50', 'signal']:
+            np.testing.assert_array_equal(expected[column], np.concatenate([p[column] for p in parts]))
+
+    def test_window_strategy_signals_match_apply_strategy(self):
+        df = synthetic_prices(n=3000, seed=5)
+        result = pd.concat(
+            self.chunked.ChunkedBacktest('breakout', period=30).run(split(df, 9))
+        )
+
+        np.testing.assert_array_equal(self.bots.apply_breakout_strategy(df, period=30)['signal'], result['signal'])
+
+
+if __name__ == '__main__':
+    unittest.main()
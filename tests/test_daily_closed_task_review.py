@@ -48,6 +48,73 @@ class TestDailyClosedTaskReview(unittest.TestCase):
             self.assertTrue(output.exists())
             self.assertIn(str(output), stdout.getvalue())
 
+    def test_walker_prunes_excluded_dirs_and_keeps_sorted_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for relative in ['b.md', 'a/z.md', 'a.md', 'a/b/c.md', 'node_modules/pkg/x.md', 'docs/.git/y.md']:
+                path = root / relative
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text('- [x] Task\n', encoding='utf-8')
+            (root / 'notes.txt').write_text('- [x] Not markdown\n', encoding='utf-8')
+
+            scanned = []
+            real_scandir = daily_review.os.scandir
+
+            def recording_scandir(path):
+                scanned.append(Path(path).relative_to(root).as_posix())
+                return real_scandir(path)
+
+            with patch.object(daily_review.os, 'scandir', recording_scandir):
+                files = [path.relative_to(root).as_posix() for path in daily_review.iter_markdown_files(root)]
+
+            self.assertEqual(['a/b/c.md', 'a/z.md', 'a.md', 'b.md'], files)
+            self.assertNotIn('node_modules', scanned)
+            self.assertNotIn('docs/.git', scanned)
+
+            tasks = daily_review.find_closed_tasks(root, workers=4)
+            self.assertEqual(files, [task.path.as_posix() for task in tasks])
+
+    def test_scan_cache_skips_unchanged_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            cache_path = root / '.cache' / 'scan.json'
+            (root / 'A.md').write_text('- [x] First\n', encoding='utf-8')
+            (root / 'B.md').write_text('- [x] Second\n', encoding='utf-8')
+            daily_review.find_closed_tasks(root, daily_review.ScanCache(cache_path))
+
+            (root / 'B.md').write_text('- [x] Second\n- [x] Third\n', encoding='utf-8')
+            cache = daily_review.ScanCache(cache_path)
+            with patch.object(daily_review, 'parse_closed_tasks', wraps=daily_review.parse_closed_tasks) as parse:
+                tasks = daily_review.find_closed_tasks(root, cache)
+
+            self.assertEqual(['First', 'Second', 'Third'], [task.text for task in tasks])
+            self.assertEqual(1, parse.call_count)
+            self.assertEqual(1, cache.hits)
+
+    def test_previous_report_lists_only_newly_closed_tasks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            output = root / 'reports' / 'review.md'
+            (root / 'TASKS.md').write_text('- [x] Old task\n', encoding='utf-8')
+            argv = ['daily_closed_task_review.py', '--root', str(root), '--output', str(output)]
+            with patch.object(sys, 'argv', argv), redirect_stdout(io.StringIO()):
+                daily_review.main()
+
+            (root / 'TASKS.md').write_text('- [x] New task\n- [x] Old task\n', encoding='utf-8')
+            stdout = io.StringIO()
+            with patch.object(sys, 'argv', argv + ['--previous-report', str(output)]), redirect_stdout(stdout):
+                daily_review.main()
+
+            self.assertIn('1 newly closed', stdout.getvalue())
+            report = output.read_text(encoding='utf-8')
+            newly_closed = report.split('## Newly closed tasks')[1].split('## Closed tasks')[0]
+            self.assertIn('New task', newly_closed)
+            self.assertNotIn('Old task', newly_closed)
+            self.assertEqual(
+                {('TASKS.md', 'New task'), ('TASKS.md', 'Old task')},
+                daily_review.read_report_tasks(output),
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
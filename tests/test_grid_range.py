@@ -0,0 +1,68 @@
+import sys
+import unittest
+from pathlib import Path
+
+from support import RecordingManager
+
+try:
+    import numpy as np
+    import pandas as pd
+    import ta  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependencies
+    np = pd = None
+
+STR_ONE_PATH = Path(__file__).resolve().parents[1] / 'STR_ONE'
+
+
+def load_grid_range():
+    sys.path.insert(0, str(STR_ONE_PATH))
+    try:
+        from str_one.bots import grid_range
+    finally:
+        sys.path.remove(str(STR_ONE_PATH))
+    return grid_range
+
+
+@unittest.skipIf(np is None, 'numpy, pandas and ta are required')
+class TestGridRange(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.grid_range = load_grid_range()
+
+    def test_rolling_extremes_match_pandas_rolling(self):
+        rng = np.random.default_rng(7)
+        highs = rng.normal(100, 5, 500)
+        lows = highs - rng.uniform(0, 3, 500)
+        tracker = self.grid_range.RollingExtremes(20)
+
+        tracked = np.array([tracker.update(h, l) for h, l in zip(highs, lows)])
+
+        expected_high = pd.Series(highs).rolling(20, min_periods=1).max().to_numpy()
+        expected_low = pd.Series(lows).rolling(20, min_periods=1).min().to_numpy()
+        np.testing.assert_allclose(expected_high, tracked[:, 0])
+        np.testing.assert_allclose(expected_low, tracked[:, 1])
+
+    def test_grid_levels_are_vectorized_over_assets(self):
+        levels = self.grid_range.grid_levels([110.0, 20.0], [100.0, 10.0], levels_count=6)
+
+        self.assertEqual((2, 6), levels.shape)
+        np.testing.assert_allclose([100, 102, 104, 106, 108, 110], levels[0])
+        np.testing.assert_allclose([10, 12, 14, 16, 18, 20], levels[1])
+
+    def test_downward_level_crossing_sends_buy(self):
+        closes = [100.0, 110.0, 105.0, 108.0, 104.0, 101.5]
+        df = pd.DataFrame({'high': [110.0] * 6, 'low': [100.0] * 6, 'close': closes})
+        manager = RecordingManager()
+
+        self.grid_range.GridRangeBot('bot_10', manager, levels_count=6, refresh_bars=2).on_new_data(df)
+
+        result = self.grid_range.apply_strategy(df, levels_count=6, refresh_bars=2)
+        self.assertEqual([0, -1, 1, -1, 1, 1], result['signal'].tolist())
+        bot_id, signal = manager.received[0]
+        self.assertEqual('bot_10', bot_id)
+        self.assertEqual('buy', signal['signal'])
+        self.assertAlmostEqual(4.0, signal['score'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import sys
+import time
+import unittest
+from pathlib import Path
+
+from support import synthetic_prices
+
+try:
+    import numpy as np
+    import pandas as pd
+    import ta  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependencies
+    np = pd = None
+
+STR_ONE_PATH = Path(__file__).resolve().parents[1] / 'STR_ONE'
+
+
+def import_str_one():
+    sys.path.insert(0, str(STR_ONE_PATH))
+    try:
+        from str_one import bots, indicators
+    finally:
+        sys.path.remove(str(STR_ONE_PATH))
+    return bots, indicators
+
+
+def pandas_rsi(series, period):
+    delta = series.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    return 100 - (100 / (1 + gain / loss))
+
+
+@unittest.skipIf(np is None, 'numpy, pandas and ta are required')
+class TestIndicators(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bots, cls.indicators = import_str_one()
+
+    def test_rolling_kernels_match_pandas(self):
+        close = synthetic_prices()['close']
+        close.iloc[[100, 101, 900]] = np.nan
+        values = close.to_numpy()
+        rolling = close.rolling(window=20)
+        ind = self.indicators
+
+        np.testing.assert_allclose(rolling.mean(), ind.rolling_mean(values, 20), rtol=1e-10)
+        np.testing.assert_allclose(rolling.std(), ind.rolling_std(values, 20), rtol=1e-7)
+        np.testing.assert_allclose(rolling.max(), ind.rolling_max(values, 20))
+        np.testing.assert_allclose(rolling.min(), ind.rolling_min(values, 20))
+        np.testing.assert_allclose(close.shift(1), ind.shift(values))
+        np.testing.assert_allclose(pandas_rsi(close, 5), ind.rsi(values, 5), rtol=1e-7)
+
+    def test_rolling_var_is_stable_for_large_offsets(self):
+        values = 1e9 + np.tile([1.0, 2.0, 3.0, 4.0], 50)
+
+        np.testing.assert_allclose(np.full(197, 1.25), self.indicators.rolling_var(values, 4, ddof=0)[3:])
+
+    def test_kernels_match_pandas_across_segments(self):
+        ind = self.indicators
+        close = synthetic_prices(n=5000)['close']
+        close.iloc[[511, 512, 1023, 2047, 4000]] = np.nan
+        values = close.to_numpy()
+        saved = ind._BLOCK, ind._VAR_SEGMENT
+        ind._BLOCK, ind._VAR_SEGMENT = 512, 256
+        try:
+            for window in (1, 7, 20, 300):
+                rolling = close.rolling(window=window)
+                np.testing.assert_allclose(rolling.max(), ind.rolling_max(values, window))
+                np.testing.assert_allclose(rolling.min(), ind.rolling_min(values, window))
+                np.testing.assert_allclose(rolling.std(), ind.rolling_std(values, window), rtol=1e-7)
+        finally:
+            ind._BLOCK, ind._VAR_SEGMENT = saved
+
+    def test_kernels_are_not_slower_than_pandas(self):
+        close = synthetic_prices(n=200_000)['close']
+        values = close.to_numpy()
+
+        def best(func):
+            samples = []
+            for _ in range(5):
+                start = time.perf_counter()
+                func()
+                samples.append(time.perf_counter() - start)
+            return min(samples)
+
+        ind = self.indicators
+        cases = [
+            (lambda: ind.rolling_max(values, 20), lambda: close.rolling(20).max()),
+            (lambda: ind.rolling_min(values, 100), lambda: close.rolling(100).min()),
+            (lambda: ind.rolling_std(values, 20), lambda: close.rolling(20).std()),
+        ]
+        for kernel, reference in cases:
+            # Generous margin: the kernels are about 2x faster on a quiet machine.
+            self.assertLess(best(kernel), 1.25 * best(reference))
+
+    def test_strategies_match_pandas_reference(self):
+        df = synthetic_prices()
+
+        trend = self.bots.apply_strategy(df)
+        ma_short = df['close'].rolling(20).mean()
+        ma_long = df['close'].rolling(50).mean()
+        expected = np.zeros(len(df), dtype=int)
+        expected[20:] = np.where(ma_short[20:] > ma_long[20:], 1, -1)
+        np.testing.assert_allclose(ma_long, trend['ma_long'], rtol=1e-10)
+        np.testing.assert_array_equal(expected, trend['signal'])
+
+        breakout = self.bots.apply_breakout_strategy(df)
+        upper = df['high'].rolling(20).max()
+        lower = df['low'].rolling(20).min()
+        expected = np.where(df['close'] > upper.shift(1), 1, np.where(df['close'] < lower.shift(1), -1, 0))
+        np.testing.assert_array_equal(expected, breakout['signal'])
+
+        reversion = self.bots.apply_mean_reversion_strategy(df)
+        rsi = pandas_rsi(df['close'], 5)
+        ma20 = df['close'].rolling(20).mean()
+        std = df['close'].rolling(20).std()
+        expected = np.where(
+            (rsi < 30) & (df['close'] < ma20 - 2 * std),
+            1,
+            np.where((rsi > 70) & (df['close'] > ma20 + 2 * std), -1, 0),
+        )
+        np.testing.assert_allclose(std, reversion['std'], rtol=1e-7)
+        np.testing.assert_array_equal(expected, reversion['signal'])
+
+    def test_compact_mode_matches_within_documented_tolerances(self):
+        df = synthetic_prices()
+        columns_before = list(df.columns)
+        cases = [
+            (self.bots.apply_strategy, ['ma_short', 'ma_long']),
+            (self.bots.apply_breakout_strategy, ['upper_band', 'lower_band']),
+            (self.bots.apply_mean_reversion_strategy, ['ma20', 'lower_bb', 'upper_bb']),
+        ]
+        for func, columns in cases:
+            full = func(df)
+            compact = func(df, compact=True)
+
+            self.assertEqual(columns + ['signal'], list(compact.columns))
+            self.assertTrue(all(compact[column].dtype == np.float32 for column in columns))
+            self.assertEqual(np.int8, compact['signal'].dtype)
+            for column in columns:
+                np.testing.assert_allclose(full[column], compact[column], rtol=1e-6)
+            self.assertLessEqual((full['signal'] != compact['signal']).mean(), 0.001)
+
+        np.testing.assert_allclose(
+            self.indicators.rsi(df['close'].to_numpy(), 5),
+            self.indicators.rsi(df['close'].to_numpy(np.float32), 5),
+            atol=0.05,
+        )
+        self.assertEqual(columns_before, list(df.columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from support import RecordingManager
+
+STR_ONE_PATH = Path(__file__).resolve().parents[1] / 'STR_ONE'
+
+# Load profiling module directly to avoid importing optional deps
+PROFILING_PATH = STR_ONE_PATH / 'str_one' / 'profiling.py'
+spec = importlib.util.spec_from_file_location('str_one_profiling', PROFILING_PATH)
+profiling = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = profiling
+spec.loader.exec_module(profiling)
+
+try:
+    import numpy as np
+    import pandas as pd
+    import ta  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependencies
+    np = pd = None
+
+
+class TestLatencyProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = profiling.LatencyProfiler(capacity=100)
+        self.profiler.enabled = True
+
+    def test_nested_stages_record_self_time_under_enclosing_bot(self):
+        with self.profiler.stage('bot_01', 'on_new_data'):
+            with self.profiler.stage(None, 'apply_strategy'):
+                pass
+
+        inner, outer = self.profiler.records
+        self.assertEqual(('bot_01', ('on_new_data', 'apply_strategy')), (inner.bot_id, inner.path))
+        self.assertEqual(('on_new_data',), outer.path)
+        self.assertAlmostEqual(outer.seconds - inner.seconds, outer.self_seconds)
+        self.assertEqual(
+            ['bot_01;on_new_data 0', 'bot_01;on_new_data;apply_strategy 0'],
+            [line.rsplit(' ', 1)[0] + ' 0' for line in self.profiler.collapsed_stacks()],
+        )
+
+    def test_disabled_profiler_records_nothing_and_buffer_is_bounded(self):
+        self.profiler.enabled = False
+        with self.profiler.stage('bot_01', 'on_new_data'):
+            pass
+        self.assertEqual(0, len(self.profiler.records))
+
+        self.profiler.enabled = True
+        for i in range(150):
+            with self.profiler.stage(f'bot_{i:02d}', 'on_new_data'):
+                pass
+        self.assertEqual(100, len(self.profiler.records))
+        self.assertEqual(3, len(self.profiler.slowest_bots(limit=3)))
+
+    def test_dump_collapsed_writes_file(self):
+        with self.profiler.stage('bot_01', 'on_new_data'):
+            pass
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.profiler.dump_collapsed(Path(tmp) / 'stacks.txt')
+            self.assertTrue(path.read_text(encoding='utf-8').startswith('bot_01;on_new_data '))
+
+
+@unittest.skipIf(np is None, 'numpy, pandas and ta are required')
+class TestBotProfiling(unittest.TestCase):
+    def test_bot_stages_are_attributed_per_bot(self):
+        sys.path.insert(0, str(STR_ONE_PATH))
+        try:
+            from str_one import profiling as package_profiling
+            from str_one.bots import TrendFollowingBot
+        finally:
+            sys.path.remove(str(STR_ONE_PATH))
+
+        df = pd.DataFrame({'close': np.linspace(100.0, 120.0, 80)})
+        package_profiling.enable()
+        try:
+            TrendFollowingBot('bot_07', RecordingManager()).on_new_data(df)
+        finally:
+            package_profiling.disable()
+        profiler = package_profiling.get_profiler()
+        stages = {(bot_id, stage) for bot_id, stage in profiler.summary()}
+        profiler.clear()
+
+        self.assertEqual(
+            {('bot_07', 'on_new_data'), ('bot_07', 'generate_signal'),
+             ('bot_07', 'apply_strategy'), ('bot_07', 'receive_signal')},
+            stages,
+        )
+
+    def test_manager_ingestion_is_timed(self):
+        sys.path.insert(0, str(STR_ONE_PATH))
+        try:
+            from str_one import profiling as package_profiling
+            from str_one.metanet_manager import MetaNetManager
+        finally:
+            sys.path.remove(str(STR_ONE_PATH))
+
+        manager = MetaNetManager()
+        package_profiling.enable()
+        try:
+            manager.receive_signal('bot_03', {'asset': 'BTCUSD', 'score': 1.0, 'signal': 'buy'})
+            manager.compute_global_signal()
+        finally:
+            package_profiling.disable()
+        profiler = package_profiling.get_profiler()
+        stages = set(profiler.summary())
+        profiler.clear()
+
+        self.assertEqual({('bot_03', 'ingest'), ('metanet', 'compute_global_signal')}, stages)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import importlib
+import os
+import sys
+import textwrap
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from support import synthetic_prices
+
+try:
+    import numpy as np
+    import pandas as pd
+    import ta  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependencies
+    np = pd = None
+
+STR_ONE_PATH = Path(__file__).resolve().parents[1] / 'STR_ONE'
+
+
+def import_result_cache():
+    sys.path.insert(0, str(STR_ONE_PATH))
+    try:
+        from str_one import bots, result_cache
+    finally:
+        sys.path.remove(str(STR_ONE_PATH))
+    return bots, result_cache
+
+
+@unittest.skipIf(pd is None, 'pandas, numpy and ta are required')
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.bots, self.result_cache = import_result_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = self.result_cache.ResultCache(self.tmp.name)
+        self.df = synthetic_prices(n=500)
+
+    def test_hit_rebuilds_identical_frame(self):
+        btc4h5m, trend_following = self.bots.btc4h5m, self.bots.trend_following
+        for func, kwargs in [
+            (trend_following.apply_strategy, {'short_window': 5}),
+            (trend_following.apply_strategy, {'compact': True}),
+            (btc4h5m.apply_strategy, {'params': btc4h5m.StrategyParams(rsi_len=7)}),
+        ]:
+            with self.subTest(func=func.__module__, **{k: str(v) for k, v in kwargs.items()}):
+                expected = func(self.df, **kwargs)
+                self.cache.apply(func, self.df, **kwargs)
+                hits = self.cache.hits
+                result = self.cache.apply(func, self.df, **kwargs)
+                self.assertEqual(hits + 1, self.cache.hits)
+                pd.testing.assert_frame_equal(expected, result)
+
+    def test_frames_with_timestamp_column(self):
+        df = self.df.assign(timestamp=pd.date_range('2024-01-01', periods=len(self.df), freq='5min'))
+        expected = self.bots.apply_strategy(df)
+        self.cache.apply(self.bots.apply_strategy, df)
+        result = self.cache.apply(self.bots.apply_strategy, df)
+
+        self.assertEqual(1, self.cache.hits)
+        pd.testing.assert_frame_equal(expected, result)
+
+    def test_reapplying_to_own_output_stores_overwritten_columns(self):
+        apply = self.bots.apply_strategy
+        first = apply(self.df, short_window=5)
+        expected = apply(first, short_window=10)
+        self.cache.apply(apply, first, short_window=10)
+        result = self.cache.apply(apply, first, short_window=10)
+
+        self.assertEqual(1, self.cache.hits)
+        pd.testing.assert_frame_equal(expected, result)
+
+    def test_key_depends_on_data_and_bound_params(self):
+        wrapped = self.cache.wrap(self.bots.apply_strategy)
+        wrapped(self.df, 10)
+        wrapped(self.df, short_window=10, long_window=50)
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+        wrapped(self.df, 11)
+        changed = self.df.copy()
+        changed.loc[7, 'close'] += 1e-9
+        wrapped(changed, 10)
+        self.assertEqual((1, 3), (self.cache.hits, self.cache.misses))
+
+    def test_editing_and_reloading_a_strategy_module_misses(self):
+        source = textwrap.dedent('''
+            def _scale():
+                return {scale}
+
+
+            def apply_strategy(df, period=3):
+                return df.assign(signal=(df['close'].diff(period) > 0).astype(int) * _scale())
+        ''')
+        module_dir = Path(self.tmp.name) / 'modules'
+        module_dir.mkdir()
+        path = module_dir / 'edited_strategy.py'
+        path.write_text(source.format(scale=1))
+        sys.path.insert(0, str(module_dir))
+        self.addCleanup(sys.path.remove, str(module_dir))
+        self.addCleanup(sys.modules.pop, 'edited_strategy', None)
+        module = importlib.import_module('edited_strategy')
+        apply_cached = self.cache.wrap(module.apply_strategy)
+        apply_cached(self.df)
+
+        # Only a helper changes; the new source has the same size and mtime
+        # resolution may not tell the files apart, so drop the stale bytecode.
+        path.write_text(source.format(scale=2))
+        importlib.invalidate_caches()
+        for cached in module_dir.glob('__pycache__/*'):
+            cached.unlink()
+        module = importlib.reload(module)
+        result = self.cache.apply(module.apply_strategy, self.df)
+
+        self.assertEqual((0, 2), (self.cache.hits, self.cache.misses))
+        pd.testing.assert_frame_equal(module.apply_strategy(self.df), result)
+        self.assertEqual({0, 2}, set(result['signal']))
+
+    def test_least_recently_used_files_are_evicted(self):
+        apply = self.bots.apply_strategy
+        frames = [synthetic_prices(n=500, seed=seed) for seed in range(3)]
+        for df in frames[:2]:
+            self.cache.apply(apply, df)
+        size = self.cache.stats()['bytes'] // 2
+        first, second = Path(self.tmp.name).glob('*.npz')
+        old = time.time() - 60
+        os.utime(second, (old, old))
+        os.utime(first, (old + 1, old + 1))
+
+        self.cache.max_bytes = 2 * size
+        self.cache.apply(apply, frames[2])
+
+        remaining = set(Path(self.tmp.name).glob('*.npz'))
+        self.assertEqual(2, len(remaining))
+        self.assertNotIn(second, remaining)
+        self.assertIn(first, remaining)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+try:
+    import numpy as np
+    import pandas as pd
+    import ta  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependencies
+    np = pd = None
+
+STR_ONE_PATH = Path(__file__).resolve().parents[1] / 'STR_ONE'
+
+
+def import_server():
+    sys.path.insert(0, str(STR_ONE_PATH))
+    try:
+        from str_one import metanet_manager, server
+    finally:
+        sys.path.remove(str(STR_ONE_PATH))
+    return metanet_manager, server
+
+
+def signal(score, side, confidence=1.0):
+    return {'asset': 'BTCUSD', 'score': score, 'signal': side, 'confidence': confidence}
+
+
+@unittest.skipIf(pd is None, 'pandas, numpy and ta are required')
+class TestMetaNetServer(unittest.TestCase):
+    def setUp(self):
+        self.metanet_manager, self.server = import_server()
+        self.manager = self.metanet_manager.MetaNetManager()
+
+    def test_pipelined_batches_over_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'metanet.sock')
+            with self.server.serve_in_thread(self.manager, path=path) as srv:
+                with self.server.MetaNetClient(srv.address) as client:
+                    accepted = client.send_batches([
+                        [('bot_01', signal(0.5, 'buy')), ('bot_02', signal(-0.2, 'sell', 0.5))],
+                        [('bot_03', signal(0.1, 'buy')), ('bot_x', signal(1.0, 'buy'))],
+                    ])
+                    result = client.global_signal()
+
+        self.assertEqual(3, accepted)
+        self.assertEqual(3, srv.received)
+        self.assertEqual({'weighted_score': 0.2, 'aggregated_signal': 'buy'}, result)
+
+    def test_long_pipelines_do_not_stall(self):
+        batches = [[(self.manager.bot_ids[i % 99], signal(0.1, 'buy'))] for i in range(20_000)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'metanet.sock')
+            with self.server.serve_in_thread(self.manager, path=path) as srv:
+                with self.server.MetaNetClient(srv.address) as client:
+                    accepted = client.send_batches(batches)
+
+        self.assertEqual(20_000, accepted)
+
+    def test_pooled_client_shared_by_threads_over_tcp(self):
+        with self.server.serve_in_thread(self.manager, host='127.0.0.1', port=0) as srv:
+            with self.server.MetaNetClient(srv.address, pool_size=2) as client:
+                def push(bot_ids):
+                    for bot_id in bot_ids:
+                        client.send_signals([(bot_id, signal(1.0, 'buy'))])
+
+                threads = [
+                    threading.Thread(target=push, args=(self.manager.bot_ids[i::4],))
+                    for i in range(4)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                self.assertLessEqual(client._pool.qsize(), 2)
+                self.assertEqual('buy', client.global_signal()['aggregated_signal'])
+                client.reset()
+
+        self.assertEqual(99, srv.received)
+        self.assertTrue(all(value is None for value in self.manager.signals.values()))
+
+    def test_invalid_entries_are_skipped_and_reported(self):
+        with self.server.serve_in_thread(self.manager, port=0) as srv:
+            with self.server.MetaNetClient(srv.address) as client:
+                (reply,) = client.pipeline([{'op': 'signals', 'signals': [
+                    ['bot_01', signal(0.5, 'buy')],
+                    ['bot_02', signal('high', 'buy')],
+                    ['bot_03', {'score': 1.0}],
+                    ['bot_04'],
+                    ['bot_05', signal(-0.5, 'sell')],
+                ]}])
+
+        self.assertTrue(reply['ok'])
+        self.assertEqual(2, reply['accepted'])
+        self.assertEqual([1, 2, 3], [index for index, _ in reply['rejected']])
+        self.assertEqual(2, srv.received)
+        self.assertEqual(['bot_01', 'bot_05'], [k for k, v in self.manager.signals.items() if v is not None])
+
+    def test_bad_requests_get_error_replies(self):
+        with self.server.serve_in_thread(self.manager, port=0) as srv:
+            with self.server.MetaNetClient(srv.address) as client:
+                unknown, malformed, ok = client.pipeline([
+                    {'op': 'nope'},
+                    {'op': 'signals', 'signals': 5},
+                    {'op': 'global'},
+                ])
+
+        self.assertFalse(unknown['ok'])
+        self.assertFalse(malformed['ok'])
+        self.assertTrue(ok['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
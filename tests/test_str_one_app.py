@@ -0,0 +1,134 @@
+import io
+import importlib.util
+import json
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Load main module directly to avoid importing the optional bot deps
+MAIN_PATH = Path(__file__).resolve().parents[1] / 'STR_ONE' / 'str_one' / 'main.py'
+spec = importlib.util.spec_from_file_location('str_one_main', MAIN_PATH)
+str_one_main = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = str_one_main
+spec.loader.exec_module(str_one_main)
+
+StrOneApp = str_one_main.StrOneApp
+
+
+class TestStrOneApp(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.app = StrOneApp(str(self.tmp / 'qa.db'))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _count(self):
+        conn = sqlite3.connect(self.app.db_path)
+        try:
+            return conn.execute('SELECT COUNT(*) FROM qa').fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_importa_dati_streams_generator_in_batches(self):
+        righe = ((f'domanda {i}', f'risposta {i}') for i in range(2500))
+
+        stats = self.app.importa_dati(righe, batch_size=1000)
+
+        self.assertEqual(2500, stats['rows'])
+        self.assertEqual(2500, self._count())
+        self.assertGreater(stats['rows_per_second'], 0)
+
+    def test_importa_file_reads_csv_and_jsonl(self):
+        csv_path = self.tmp / 'qa.csv'
+        csv_path.write_text('domanda,risposta\n"Ciao, come va?",Bene\nChi?,Io\n', encoding='utf-8')
+        jsonl_path = self.tmp / 'qa.jsonl'
+        jsonl_path.write_text(
+            json.dumps({'domanda': 'Dove?', 'risposta': 'Qui'}) + '\n\n',
+            encoding='utf-8',
+        )
+
+        self.assertEqual(2, self.app.importa_file(csv_path)['rows'])
+        self.assertEqual(1, self.app.importa_file(jsonl_path)['rows'])
+        self.assertEqual(3, self._count())
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.app.cerca('come va')
+        self.assertIn('Ciao, come va?', stdout.getvalue())
+
+    def test_cli_import(self):
+        jsonl_path = self.tmp / 'qa.jsonl'
+        jsonl_path.write_text(
+            '\n'.join(json.dumps({'domanda': f'd{i}', 'risposta': f'r{i}'}) for i in range(10)),
+            encoding='utf-8',
+        )
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_code = str_one_main.main(['--db', self.app.db_path, 'import', str(jsonl_path), '--batch-size', '3'])
+
+        self.assertEqual(0, exit_code)
+        self.assertEqual(10, self._count())
+        self.assertIn('10 righe importate', stdout.getvalue())
+
+    def test_cerca_risultati_is_cached_until_next_write(self):
+        self.app.importa_dati([('Capitale Italia?', 'Roma')])
+
+        first = self.app.cerca_risultati('roma')
+        second = self.app.cerca_risultati('ROMA')
+        self.assertEqual([('Capitale Italia?', 'Roma')], first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, self.app.cache.stats()['hits'])
+        # Whitespace is part of the LIKE pattern and of the cache key.
+        self.assertEqual([], self.app.cerca_risultati(' roma '))
+
+        self.app.importa_dati([('Citta eterna?', 'Roma')])
+        self.assertEqual(2, len(self.app.cerca_risultati('roma')))
+        self.assertEqual(3, self.app.cache.stats()['misses'])
+
+    def test_search_cache_is_bounded_by_entries_and_bytes(self):
+        cache = str_one_main.SearchCache(max_entries=2, max_bytes=10_000)
+        cache.put('a', [('d', 'r')])
+        cache.put('b', [('d', 'r')])
+        cache.get('a')
+        cache.put('c', [('d', 'r')])
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+
+        cache.put('big', [('x' * 20_000, 'r')])
+        self.assertIsNone(cache.get('big'))
+        self.assertLessEqual(cache.stats()['bytes'], 10_000)
+
+    def test_search_cache_skips_sizing_results_it_will_not_keep(self):
+        # ``None`` rows would break the size estimate if they were reached.
+        str_one_main.SearchCache(max_entries=0).put('a', [None])
+        cache = str_one_main.SearchCache(max_bytes=10_000)
+        cache.put('big', [('x' * 20_000, 'r')] + [None] * 3)
+        self.assertIsNone(cache.get('big'))
+
+    def test_cerca_pagina_uses_keyset_cursor(self):
+        self.app.importa_dati([(f'domanda {i}', 'match' if i % 2 else 'altro') for i in range(10)])
+
+        first = self.app.cerca_pagina('match', limit=3)
+        second = self.app.cerca_pagina('match', limit=3, cursor=first['next_cursor'])
+
+        self.assertEqual(['domanda 1', 'domanda 3', 'domanda 5'], [row[1] for row in first['results']])
+        self.assertEqual(['domanda 7', 'domanda 9'], [row[1] for row in second['results']])
+        self.assertIsNone(second['next_cursor'])
+
+    def test_iter_risultati_streams_all_matches(self):
+        self.app.importa_dati((f'domanda {i}', 'risposta') for i in range(25))
+
+        rows = list(self.app.iter_risultati('risposta', page_size=10))
+
+        self.assertEqual(25, len(rows))
+        self.assertEqual(sorted(row[0] for row in rows), [row[0] for row in rows])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,10 +8,16 @@ scheduled workflow reviews completed decisions without touching live work.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Optional
 
 DEFAULT_EXCLUDED_DIRS = {
     ".git",
@@ -26,6 +32,10 @@ DEFAULT_EXCLUDED_DIRS = {
 }
 
 
+SCAN_CACHE_VERSION = 1
+REPORT_TASK_RE = re.compile(r"^- `(?P<path>.+):(?P<line>\d+)` — (?P<text>.*)$")
+
+
 @dataclass(frozen=True)
 class ClosedTask:
     path: Path
@@ -33,28 +43,185 @@ class ClosedTask:
     text: str
 
 
+class ScanCache:
+    """On-disk cache of parsed closed tasks, keyed by relative file path.
+
+    An entry is reused when the file's mtime and size are unchanged. When only
+    the metadata changed, the content hash decides whether the file must be
+    parsed again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == SCAN_CACHE_VERSION:
+            self.entries = data.get("files", {})
+
+    def lookup(self, key: str, stat: os.stat_result) -> Optional[list[tuple[int, str]]]:
+        entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            with self._lock:
+                self.hits += 1
+            return [tuple(task) for task in entry["tasks"]]
+        return None
+
+    def lookup_content(self, key: str, digest: str, stat: os.stat_result) -> Optional[list[tuple[int, str]]]:
+        entry = self.entries.get(key)
+        with self._lock:
+            if entry and entry["sha256"] == digest:
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+                self.hits += 1
+                return [tuple(task) for task in entry["tasks"]]
+            self.misses += 1
+        return None
+
+    def store(self, key: str, stat: os.stat_result, digest: str, tasks: list[tuple[int, str]]) -> None:
+        with self._lock:
+            self.entries[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "tasks": [list(task) for task in tasks],
+            }
+
+    def save(self, seen: Iterable[str]) -> None:
+        seen = set(seen)
+        files = {key: entry for key, entry in self.entries.items() if key in seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": SCAN_CACHE_VERSION, "files": files}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
 def iter_markdown_files(root: Path) -> Iterable[Path]:
-    for path in sorted(root.rglob("*.md")):
-        if any(part in DEFAULT_EXCLUDED_DIRS for part in path.relative_to(root).parts):
+    """Yield Markdown files under ``root`` in sorted path order.
+
+    Excluded directories are pruned before they are entered and symlinked
+    directories are not followed. Each directory is listed once with
+    ``os.scandir`` and walked depth-first in name order, which matches sorting
+    the full path list without having to build it first.
+    """
+    stack = [_sorted_entries(root)]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+        elif entry.is_dir(follow_symlinks=False):
+            if entry.name not in DEFAULT_EXCLUDED_DIRS:
+                stack.append(_sorted_entries(entry.path))
+        elif entry.name.endswith(".md") and entry.is_file():
+            yield Path(entry.path)
+
+
+def _sorted_entries(directory) -> Iterator[os.DirEntry]:
+    try:
+        with os.scandir(directory) as it:
+            return iter(sorted(it, key=lambda entry: entry.name))
+    except OSError:
+        return iter(())
+
+
+def parse_closed_tasks(lines: Iterable[str]) -> list[tuple[int, str]]:
+    found: list[tuple[int, str]] = []
+    for line_number, raw_line in enumerate(lines, start=1):
+        stripped = raw_line.strip()
+        lowered = stripped.lower()
+        if not (lowered.startswith("- [x]") or lowered.startswith("* [x]")):
             continue
-        yield path
+        found.append((line_number, stripped[5:].strip()))
+    return found
+
+
+def _read_closed_tasks(path: Path) -> list[tuple[int, str]]:
+    with path.open(encoding="utf-8") as handle:
+        return parse_closed_tasks(handle)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _scan_file(path: Path, key: str, cache: Optional[ScanCache]) -> list[tuple[int, str]]:
+    if cache is None:
+        return _read_closed_tasks(path)
+
+    stat = path.stat()
+    found = cache.lookup(key, stat)
+    if found is not None:
+        return found
+    digest = _file_sha256(path)
+    found = cache.lookup_content(key, digest, stat)
+    if found is None:
+        found = _read_closed_tasks(path)
+        cache.store(key, stat, digest, found)
+    return found
+
 
+def find_closed_tasks(
+    root: Path,
+    cache: Optional[ScanCache] = None,
+    workers: Optional[int] = None,
+) -> list[ClosedTask]:
+    """Scan ``root`` for closed tasks, parsing files across a thread pool.
 
-def find_closed_tasks(root: Path) -> list[ClosedTask]:
+    Results keep the walker's sorted file order. ``workers=1`` parses files
+    serially in the calling thread.
+    """
+    relatives = [path.relative_to(root) for path in iter_markdown_files(root)]
+    keys = [relative.as_posix() for relative in relatives]
+
+    def scan(index: int) -> list[tuple[int, str]]:
+        return _scan_file(root / relatives[index], keys[index], cache)
+
+    if workers == 1 or len(relatives) < 2:
+        tasks = _collect(relatives, map(scan, range(len(relatives))))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            tasks = _collect(relatives, pool.map(scan, range(len(relatives))))
+    if cache is not None:
+        cache.save(keys)
+    return tasks
+
+
+def _collect(relatives: list[Path], results: Iterable[list[tuple[int, str]]]) -> list[ClosedTask]:
     tasks: list[ClosedTask] = []
-    for path in iter_markdown_files(root):
-        lines = path.read_text(encoding="utf-8").splitlines()
-        for line_number, raw_line in enumerate(lines, start=1):
-            stripped = raw_line.strip()
-            lowered = stripped.lower()
-            if not (lowered.startswith("- [x]") or lowered.startswith("* [x]")):
-                continue
-            task_text = stripped[5:].strip()
-            tasks.append(ClosedTask(path.relative_to(root), line_number, task_text))
+    for relative, found in zip(relatives, results):
+        tasks.extend(ClosedTask(relative, line_number, text) for line_number, text in found)
     return tasks
 
 
-def build_report(root: Path, tasks: list[ClosedTask]) -> str:
+def read_report_tasks(report: Path) -> set[tuple[str, str]]:
+    """Return ``(path, text)`` pairs listed in a previously generated report."""
+    try:
+        lines = report.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return set()
+    found = set()
+    for line in lines:
+        match = REPORT_TASK_RE.match(line)
+        if match:
+            found.add((Path(match["path"]).as_posix(), match["text"]))
+    return found
+
+
+def new_closed_tasks(tasks: list[ClosedTask], previous: set[tuple[str, str]]) -> list[ClosedTask]:
+    # Line numbers shift as files are edited, so tasks are matched on path and text.
+    return [task for task in tasks if (task.path.as_posix(), task.text) not in previous]
+
+
+def build_report(root: Path, tasks: list[ClosedTask], new_tasks: Optional[list[ClosedTask]] = None) -> str:
     generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
     lines = [
         "# Daily closed-task review",
@@ -69,8 +236,23 @@ def build_report(root: Path, tasks: list[ClosedTask]) -> str:
         "- Active tasks: **skipped by design**",
         "",
     ]
+    if new_tasks is not None:
+        lines.insert(-1, f"- Newly closed since previous report: **{len(new_tasks)}**")
+        lines.extend(["## Newly closed tasks", ""])
+        if new_tasks:
+            for task in new_tasks:
+                lines.append(f"- `{task.path}:{task.line}` — {task.text}")
+        else:
+            lines.append("No tasks were closed since the previous report.")
+        lines.append("")
 
-    if tasks:
+    if tasks and new_tasks is not None:
+        # Keep the full list (collapsed) so this report can serve as the next baseline.
+        lines.extend(["## Closed tasks", "", "<details>", "<summary>All closed tasks</summary>", ""])
+        for task in tasks:
+            lines.append(f"- `{task.path}:{task.line}` — {task.text}")
+        lines.extend(["", "</details>", ""])
+    elif tasks:
         lines.extend(["## Closed tasks", ""])
         for task in tasks:
             lines.append(f"- `{task.path}:{task.line}` — {task.text}")
@@ -106,19 +288,45 @@ def main() -> int:
         default=Path("reports/daily-closed-task-review.md"),
         help="Report path, relative to root unless absolute",
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="Scan cache path, relative to root unless absolute; unchanged files are not re-parsed",
+    )
+    parser.add_argument(
+        "--previous-report",
+        type=Path,
+        help="Earlier report to diff against; newly closed tasks are listed separately",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Threads used to parse files (default: ThreadPoolExecutor's default)",
+    )
     args = parser.parse_args()
 
     root = args.root.resolve()
     output = args.output if args.output.is_absolute() else root / args.output
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    tasks = find_closed_tasks(root)
-    output.write_text(build_report(root, tasks), encoding="utf-8")
+    cache = None
+    if args.cache is not None:
+        cache = ScanCache(args.cache if args.cache.is_absolute() else root / args.cache)
+
+    tasks = find_closed_tasks(root, cache, args.workers)
+    new_tasks = None
+    if args.previous_report is not None:
+        previous = args.previous_report if args.previous_report.is_absolute() else root / args.previous_report
+        new_tasks = new_closed_tasks(tasks, read_report_tasks(previous))
+    output.write_text(build_report(root, tasks, new_tasks), encoding="utf-8")
     try:
         shown = output.relative_to(root)
     except ValueError:
         shown = output
-    print(f"Reviewed {len(tasks)} closed task(s). Report written to {shown}")
+    summary = f"Reviewed {len(tasks)} closed task(s)"
+    if new_tasks is not None:
+        summary += f", {len(new_tasks)} newly closed"
+    print(f"{summary}. Report written to {shown}")
     return 0
 
 